@@ -40,7 +40,7 @@ from src.lookthrough.db.models import (
     FactReportedHolding,
     GICSMapping,
 )
-from src.lookthrough.taxonomy.gics import get_sub_industry_lookup, get_gics_taxonomy
+from src.lookthrough.taxonomy.gics import get_descendants, get_gics_nodes_by_level, get_sub_industry_lookup
 
 
 # ----------------------------
@@ -120,21 +120,16 @@ def _coerce_gics_codes_to_float(record: dict) -> dict:
 
 def _build_gics_reference() -> str:
     """Build a compact reference of all GICS sub-industries for the prompt."""
-    taxonomy = get_gics_taxonomy()
+    sub_industry_lookup = get_sub_industry_lookup()
     lines = []
 
     # Group by sector for readability
-    sectors = [n for n in taxonomy if n["level"] == "sector"]
-    for sector in sectors:
+    for sector in get_gics_nodes_by_level()["sector"]:
         lines.append(f"\n## {sector['code']} - {sector['name']}")
 
-        # Get sub-industries under this sector
-        sub_industries = [
-            n for n in taxonomy
-            if n["level"] == "sub_industry" and n["code"].startswith(sector["code"])
-        ]
-        for si in sub_industries:
-            lines.append(f"  {si['code']}: {si['name']}")
+        # Sub-industries under this sector
+        for code in get_descendants(sector["code"]):
+            lines.append(f"  {code}: {sub_industry_lookup[code]['gics_sub_industry_name']}")
 
     return "\n".join(lines)
 
@@ -437,8 +432,7 @@ def main() -> None:
     # Build GICS reference and valid codes set
     # -----------------------------------------------------------------------
     gics_reference = _build_gics_reference()
-    taxonomy = get_gics_taxonomy()
-    valid_codes = {n["code"] for n in taxonomy if n["level"] == "sub_industry"}
+    valid_codes = {n["code"] for n in get_gics_nodes_by_level()["sub_industry"]}
 
     client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
@@ -262,6 +262,11 @@ def dataframe_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
     Returns:
         List of dicts with column values
     """
+    # Categorical columns can't hold None, so decode them before the NaN swap
+    category_cols = df.select_dtypes(include="category").columns
+    if len(category_cols) > 0:
+        df = df.astype({col: object for col in category_cols})
+
     # Replace NaN with None for database compatibility
     df_clean = df.where(pd.notnull(df), None)
     return df_clean.to_dict('records')
@@ -2,19 +2,21 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 import uuid
 
 import numpy as np
 import pandas as pd
 
+from sqlalchemy import delete
+
+from src.lookthrough.db.engine import get_session_context
 from src.lookthrough.db.repository import (
     _is_csv_mode,
-    bulk_insert,
     dataframe_to_records,
-    delete_all,
     get_all,
     get_filtered,
 )
@@ -40,10 +42,48 @@ class InferenceConfig:
     scale_exposure_to_nav:
         If true, normalize holdings weights so they sum to 1.0 per fund report.
         If false, allow gross sums != 1.0 (useful for leverage / net short cases later).
+    max_workers:
+        Worker processes used to infer quarters. The default of 1 runs every
+        quarter in-process; raise it to opt in to a process pool for large runs.
     """
     portfolio_total_value_usd: float = 100_000_000.0
     fund_weight_method: str = "equal"
     scale_exposure_to_nav: bool = True
+    max_workers: int = 1
+
+
+# Columns inference reads from the silver inputs (others are skipped at load time)
+PORTFOLIO_COLUMNS = ["portfolio_id"]
+FUND_REPORT_COLUMNS = ["fund_report_id", "fund_id", "report_period_end", "coverage_estimate"]
+HOLDING_COLUMNS = [
+    "fund_report_id",
+    "raw_company_name",
+    "company_id",
+    "reported_value_usd",
+    "reported_pct_nav",
+]
+FUND_REPORT_DTYPES = {"fund_report_id": "category", "fund_id": "category", "coverage_estimate": "float64"}
+HOLDING_DTYPES = {
+    "fund_report_id": "category",
+    "raw_company_name": "category",
+    "company_id": "string",
+    "reported_value_usd": "float64",
+    "reported_pct_nav": "float64",
+}
+
+EXPOSURE_COLUMNS = [
+    "exposure_id",
+    "run_id",
+    "portfolio_id",
+    "fund_id",
+    "company_id",
+    "raw_company_name",
+    "as_of_date",
+    "exposure_value_usd",
+    "exposure_weight",
+    "exposure_type",
+    "method",
+]
 
 
 def _repo_root() -> Path:
@@ -51,10 +91,16 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
-def _read_csv(path: Path) -> pd.DataFrame:
+def _read_csv(
+    path: Path,
+    usecols: Optional[list[str]] = None,
+    dtype: Optional[dict[str, str]] = None,
+) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Missing required file: {path}")
-    return pd.read_csv(path)
+    # Callable usecols skips unneeded columns without failing on optional ones
+    cols = (lambda c: c in usecols) if usecols is not None else None
+    return pd.read_csv(path, usecols=cols, dtype=dtype)
 
 
 def _safe_float(x) -> Optional[float]:
@@ -107,7 +153,189 @@ def _estimate_fund_nav(
     return float(nav_estimate), float(covered_value_usd)
 
 
-def infer_exposures_v1(cfg: InferenceConfig, csv_mode: bool = False) -> pd.DataFrame:
+def _drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink categorical columns of a slice to the categories it actually uses."""
+    category_cols = df.select_dtypes(include="category").columns
+    if len(category_cols) == 0:
+        return df
+    return df.assign(**{col: df[col].cat.remove_unused_categories() for col in category_cols})
+
+
+def _compute_exposures(
+    values: np.ndarray,
+    pcts: np.ndarray,
+    nav_est: float,
+    fund_alloc_value: float,
+    portfolio_total_value_usd: float,
+    scale_to_nav: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Translate one fund report's holdings into portfolio exposure.
+
+    Returns:
+        exposure_value_usd, exposure_weight (arrays aligned with the inputs)
+
+    Holding value prefers reported_value_usd; else reported_pct_nav * nav_est; else 0.
+    NaNs fail both `> 0` tests, so missing values fall through naturally.
+
+    If scale_to_nav=True, normalize by sum of holding values (covered holdings),
+    otherwise normalize by nav_est (allows gross exposure concepts later).
+    """
+    holding_value = np.where(values > 0, values, np.where(pcts > 0, pcts * nav_est, 0.0))
+
+    if scale_to_nav:
+        denom = float(holding_value.sum())
+        denom = denom if denom > 0 else 1.0
+    else:
+        denom = nav_est if nav_est > 0 else 1.0
+
+    # Translate to portfolio dollar exposure using fund_alloc_value
+    exposure_value = (holding_value / denom) * fund_alloc_value
+    exposure_weight = exposure_value / portfolio_total_value_usd
+    return exposure_value, exposure_weight
+
+
+def _process_quarter(
+    as_of_date,
+    fr_q: pd.DataFrame,
+    holdings: pd.DataFrame,
+    cfg: InferenceConfig,
+    run_id: str,
+    portfolio_id: str,
+) -> pd.DataFrame:
+    """
+    Infer exposures for every fund report in one quarter.
+
+    Quarters are independent of each other, so this runs in-process by default
+    or in a worker process when cfg.max_workers > 1; `holdings` only needs to
+    contain the rows for this quarter's fund reports.
+    """
+    method = "deterministic_v1"
+    exposure_type = "lookthrough"
+    as_of_date_str = str(as_of_date)
+
+    # V1: equal weight across funds reporting that quarter
+    fund_ids = fr_q["fund_id"].unique().tolist()
+    fund_weight = 1.0 / len(fund_ids)
+    fund_alloc_value = cfg.portfolio_total_value_usd * fund_weight
+
+    exposures_out = []
+
+    # For each fund report in that quarter (a report is only processed once)
+    fr_q_unique = fr_q.drop_duplicates(subset=["fund_report_id"])
+    for fr in fr_q_unique.itertuples(index=False):
+        fund_report_id = str(fr.fund_report_id)
+        fund_id = str(fr.fund_id)
+        coverage_est = _safe_float(fr.coverage_estimate) if "coverage_estimate" in fr_q.columns else None
+
+        h = holdings[holdings["fund_report_id"] == fund_report_id].copy()
+
+        # If company_id exists, prefer it; else we keep raw name (company_id will be null)
+        if "company_id" in h.columns:
+            company_ids = h["company_id"].astype(str)
+            h["company_id"] = company_ids.where(~company_ids.isin(["nan", "None", "<NA>"]), None)
+        else:
+            h["company_id"] = None
+
+        # Ensure numeric columns exist
+        if "reported_value_usd" not in h.columns:
+            h["reported_value_usd"] = np.nan
+        if "reported_pct_nav" not in h.columns:
+            h["reported_pct_nav"] = np.nan
+
+        nav_est, covered_value_usd = _estimate_fund_nav(h, coverage_estimate=coverage_est)
+
+        values = pd.to_numeric(h["reported_value_usd"], errors="coerce").to_numpy(dtype=float)
+        pcts = pd.to_numeric(h["reported_pct_nav"], errors="coerce").to_numpy(dtype=float)
+        exposure_values, exposure_weights = _compute_exposures(
+            values,
+            pcts,
+            nav_est=nav_est,
+            fund_alloc_value=fund_alloc_value,
+            portfolio_total_value_usd=cfg.portfolio_total_value_usd,
+            scale_to_nav=cfg.scale_exposure_to_nav,
+        )
+        h["exposure_value_usd"] = exposure_values
+        h["exposure_weight"] = exposure_weights
+
+        for _, row in h.iterrows():
+            exposures_out.append(
+                {
+                    "exposure_id": str(uuid.uuid4()),
+                    "run_id": run_id,
+                    "portfolio_id": portfolio_id,
+                    "fund_id": fund_id,
+                    "company_id": row["company_id"],
+                    "raw_company_name": row.get("raw_company_name"),
+                    "as_of_date": as_of_date_str,
+                    "exposure_value_usd": float(row["exposure_value_usd"]),
+                    "exposure_weight": float(row["exposure_weight"]),
+                    "exposure_type": exposure_type,
+                    "method": method,
+                }
+            )
+
+        # Add unknown exposure bucket for uncovered portion of fund NAV
+        if coverage_est is not None and coverage_est < 1.0:
+            unknown_value_usd = fund_alloc_value * (1.0 - coverage_est)
+            unknown_weight = unknown_value_usd / cfg.portfolio_total_value_usd
+            exposures_out.append(
+                {
+                    "exposure_id": str(uuid.uuid4()),
+                    "run_id": run_id,
+                    "portfolio_id": portfolio_id,
+                    "fund_id": fund_id,
+                    "company_id": None,
+                    "raw_company_name": "UNALLOCATED / UNKNOWN",
+                    "as_of_date": as_of_date_str,
+                    "exposure_value_usd": float(unknown_value_usd),
+                    "exposure_weight": float(unknown_weight),
+                    "exposure_type": "unknown",
+                    "method": method,
+                }
+            )
+
+    return pd.DataFrame(exposures_out, columns=EXPOSURE_COLUMNS)
+
+
+def _iter_quarter_exposures(
+    quarters: list[tuple],
+    cfg: InferenceConfig,
+    run_id: str,
+    portfolio_id: str,
+) -> Iterator[pd.DataFrame]:
+    """Yield each quarter's exposures in quarter order, in-process or across a worker pool."""
+    if cfg.max_workers <= 1 or len(quarters) <= 1:
+        for as_of_date, fr_q, holdings_q in quarters:
+            yield _process_quarter(as_of_date, fr_q, holdings_q, cfg, run_id, portfolio_id)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(cfg.max_workers, len(quarters))) as pool:
+        futures = [
+            pool.submit(_process_quarter, as_of_date, fr_q, holdings_q, cfg, run_id, portfolio_id)
+            for as_of_date, fr_q, holdings_q in quarters
+        ]
+        # Collect in quarter order so output is deterministic
+        for future in futures:
+            yield future.result()
+
+
+def infer_exposures_v1(cfg: InferenceConfig, csv_mode: bool = False) -> int:
+    """
+    Infer look-through exposures and write them to fact_inferred_exposure.
+
+    Quarters are inferred one at a time (or across cfg.max_workers processes)
+    and streamed to the sink quarter by quarter, so peak memory is bounded by
+    the largest quarter rather than the run.
+    The sink is replaced atomically (a temp file swapped in for CSV, a single
+    transaction for the DB), so a failed run leaves the previous output intact.
+
+    Returns:
+        Number of exposure rows written.
+    """
+    if cfg.fund_weight_method != "equal":
+        raise ValueError(f"Unsupported fund_weight_method in V1: {cfg.fund_weight_method}")
+
     root = _repo_root()
     silver = root / "data" / "silver"
     gold = root / "data" / "gold"
@@ -115,9 +343,13 @@ def infer_exposures_v1(cfg: InferenceConfig, csv_mode: bool = False) -> pd.DataF
 
     # Load required inputs from DB or CSV
     if csv_mode:
-        portfolio = _read_csv(silver / "dim_portfolio.csv")
-        fund_reports = _read_csv(silver / "fact_fund_report.csv")
-        holdings = _read_csv(silver / "fact_reported_holding.csv")
+        portfolio = _read_csv(silver / "dim_portfolio.csv", usecols=PORTFOLIO_COLUMNS)
+        fund_reports = _read_csv(
+            silver / "fact_fund_report.csv", usecols=FUND_REPORT_COLUMNS, dtype=FUND_REPORT_DTYPES
+        )
+        holdings = _read_csv(
+            silver / "fact_reported_holding.csv", usecols=HOLDING_COLUMNS, dtype=HOLDING_DTYPES
+        )
     else:
         portfolio = get_all(DimPortfolio)
         fund_reports = get_all(FactFundReport)
@@ -136,6 +368,13 @@ def infer_exposures_v1(cfg: InferenceConfig, csv_mode: bool = False) -> pd.DataF
         if col not in holdings.columns:
             raise ValueError(f"fact_reported_holding missing column: {col}")
 
+    # Repeated ID/name strings compare faster (and take less memory) as categoricals
+    for col in ["fund_id", "fund_report_id"]:
+        fund_reports[col] = fund_reports[col].astype("category")
+    for col in ["fund_report_id", "raw_company_name", "source"]:
+        if col in holdings.columns:
+            holdings[col] = holdings[col].astype("category")
+
     # Use first (and only) portfolio in V1
     portfolio_id = str(portfolio.loc[0, "portfolio_id"])
 
@@ -143,138 +382,67 @@ def infer_exposures_v1(cfg: InferenceConfig, csv_mode: bool = False) -> pd.DataF
     # We infer quarters from fund_reports.report_period_end
     fund_reports["report_period_end"] = pd.to_datetime(fund_reports["report_period_end"]).dt.date
 
-    exposures_out = []
-
     run_id = str(uuid.uuid4())
-    method = "deterministic_v1"
-    exposure_type = "lookthrough"
 
-    # Build per-quarter fund sets
+    # Build per-quarter work units, passing each worker only its own holdings slice
+    quarters = []
     for as_of_date, fr_q in fund_reports.groupby("report_period_end"):
-        fund_ids = fr_q["fund_id"].astype(str).unique().tolist()
-        if len(fund_ids) == 0:
+        if fr_q.empty:
             continue
+        holdings_q = holdings[holdings["fund_report_id"].isin(fr_q["fund_report_id"])]
+        quarters.append((as_of_date, fr_q, _drop_unused_categories(holdings_q)))
+
+    batches = _iter_quarter_exposures(quarters, cfg, run_id, portfolio_id)
+    out_path = gold / "fact_inferred_exposure.csv"
+    rows_written = 0
+
+    # Replace the previous run atomically: a failure partway through leaves it untouched
+    if csv_mode:
+        tmp_path = out_path.with_name(out_path.name + ".tmp")
+        try:
+            pd.DataFrame(columns=EXPOSURE_COLUMNS).to_csv(tmp_path, index=False)
+            for batch in batches:
+                batch.to_csv(tmp_path, mode="a", header=False, index=False)
+                rows_written += len(batch)
+            os.replace(tmp_path, out_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    else:
+        # Delete and inserts share one transaction, committed only on success
+        with get_session_context() as session:
+            session.execute(delete(FactInferredExposure))
+            for batch in batches:
+                if not batch.empty:
+                    session.bulk_insert_mappings(FactInferredExposure, dataframe_to_records(batch))
+                rows_written += len(batch)
 
-        if cfg.fund_weight_method != "equal":
-            raise ValueError(f"Unsupported fund_weight_method in V1: {cfg.fund_weight_method}")
-
-        fund_weight = 1.0 / len(fund_ids)
-        fund_alloc_value = cfg.portfolio_total_value_usd * fund_weight
-
-        # For each fund report in that quarter
-        for _, fr in fr_q.iterrows():
-            fund_report_id = str(fr["fund_report_id"])
-            fund_id = str(fr["fund_id"])
-            coverage_est = _safe_float(fr["coverage_estimate"]) if "coverage_estimate" in fr_q.columns else None
-
-            h = holdings[holdings["fund_report_id"].astype(str) == fund_report_id].copy()
-
-            # If company_id exists, prefer it; else we keep raw name (company_id will be null)
-            if "company_id" in h.columns:
-                h["company_id"] = h["company_id"].astype(str)
-            else:
-                h["company_id"] = None
-
-            # Ensure numeric columns exist
-            if "reported_value_usd" not in h.columns:
-                h["reported_value_usd"] = np.nan
-            if "reported_pct_nav" not in h.columns:
-                h["reported_pct_nav"] = np.nan
-
-            nav_est, covered_value_usd = _estimate_fund_nav(h, coverage_estimate=coverage_est)
-
-            # Compute holding value: prefer reported_value_usd; else use pct_nav * nav_est
-            def holding_value(row) -> float:
-                v = _safe_float(row.get("reported_value_usd", None))
-                if v is not None and v > 0:
-                    return float(v)
-                p = _safe_float(row.get("reported_pct_nav", None))
-                if p is not None and p > 0:
-                    return float(p) * float(nav_est)
-                return 0.0
-
-            h["holding_value_usd"] = h.apply(holding_value, axis=1)
-
-            # If scale_exposure_to_nav=True, normalize by sum of holding_value_usd (covered holdings),
-            # otherwise normalize by nav_est (allows gross exposure concepts later).
-            denom = float(h["holding_value_usd"].sum())
-            if cfg.scale_exposure_to_nav:
-                denom = denom if denom > 0 else 1.0
-            else:
-                denom = nav_est if nav_est > 0 else 1.0
-
-            h["holding_weight"] = h["holding_value_usd"] / denom
-
-            # Translate to portfolio dollar exposure using fund_alloc_value
-            h["exposure_value_usd"] = h["holding_weight"] * fund_alloc_value
-            h["exposure_weight"] = h["exposure_value_usd"] / cfg.portfolio_total_value_usd
-
-            for _, row in h.iterrows():
-                exposures_out.append(
-                    {
-                        "exposure_id": str(uuid.uuid4()),
-                        "run_id": run_id,
-                        "portfolio_id": portfolio_id,
-                        "fund_id": fund_id,
-                        "company_id": row.get("company_id") if row.get("company_id") not in ["nan", "None"] else None,
-                        "raw_company_name": row.get("raw_company_name"),
-                        "as_of_date": str(as_of_date),
-                        "exposure_value_usd": float(row["exposure_value_usd"]),
-                        "exposure_weight": float(row["exposure_weight"]),
-                        "exposure_type": exposure_type,
-                        "method": method,
-                    }
-                )
-
-            # Add unknown exposure bucket for uncovered portion of fund NAV
-            if coverage_est is not None and coverage_est < 1.0:
-                unknown_value_usd = fund_alloc_value * (1.0 - coverage_est)
-                unknown_weight = unknown_value_usd / cfg.portfolio_total_value_usd
-                exposures_out.append(
-                    {
-                        "exposure_id": str(uuid.uuid4()),
-                        "run_id": run_id,
-                        "portfolio_id": portfolio_id,
-                        "fund_id": fund_id,
-                        "company_id": None,
-                        "raw_company_name": "UNALLOCATED / UNKNOWN",
-                        "as_of_date": str(as_of_date),
-                        "exposure_value_usd": float(unknown_value_usd),
-                        "exposure_weight": float(unknown_weight),
-                        "exposure_type": "unknown",
-                        "method": method,
-                    }
-                )
-
-    exposures_df = pd.DataFrame(exposures_out)
-
-    # Write output
     if csv_mode:
-        out_path = gold / "fact_inferred_exposure.csv"
-        exposures_df.to_csv(out_path, index=False)
         print("Wrote:", out_path)
     else:
-        # Clear existing exposures for this run and insert new ones
-        delete_all(FactInferredExposure)
-        bulk_insert(FactInferredExposure, dataframe_to_records(exposures_df))
         print("Wrote: PostgreSQL:fact_inferred_exposure")
 
-    print("Rows:", len(exposures_df))
+    print("Rows:", rows_written)
     print("run_id:", run_id)
 
-    return exposures_df
+    return rows_written
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Infer exposures")
     parser.add_argument("--csv", action="store_true", help="Use CSV mode instead of PostgreSQL")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to infer quarters (default: 1, infer inline)",
+    )
     args = parser.parse_args()
 
     # Check CSV mode from args or environment
     csv_mode = args.csv or _is_csv_mode()
     print(f"Data mode: {'CSV' if csv_mode else 'PostgreSQL'}")
 
-    cfg = InferenceConfig()
+    cfg = InferenceConfig(max_workers=args.workers)
     infer_exposures_v1(cfg, csv_mode=csv_mode)
 
 
@@ -19,7 +19,7 @@ import hashlib
 import os
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import pandas as pd
 
@@ -72,6 +72,15 @@ BDC_TABLES = {
 SOURCE_SYNTHETIC = "synthetic"
 SOURCE_BDC = "bdc_filing"
 
+# Low-cardinality string columns repeated across holdings rows, per table; stored
+# as pandas categoricals to cut memory and speed up ==/isin/groupby. Key columns
+# of the fund and report tables are unique per row, so they stay plain strings.
+_HOLDING_CATEGORY_COLUMNS = ["fund_report_id", "raw_company_name", "source", "reported_sector"]
+CATEGORY_COLUMNS: dict[str, list[str]] = {
+    "fact_reported_holding.csv": _HOLDING_CATEGORY_COLUMNS,
+    BDC_TABLES["holdings"]: _HOLDING_CATEGORY_COLUMNS,
+}
+
 
 # ---------------------------------------------------------------------------
 # Deterministic UUID Generation
@@ -83,6 +92,13 @@ def make_uuid(seed: str) -> str:
     return str(uuid.UUID(bytes=hash_bytes))
 
 
+def make_uuids(seeds: Iterable[str]) -> list[str]:
+    """Generate deterministic UUIDs for many seeds (same values as make_uuid)."""
+    md5 = hashlib.md5
+    to_uuid = uuid.UUID
+    return [str(to_uuid(bytes=md5(seed.encode()).digest())) for seed in seeds]
+
+
 # ---------------------------------------------------------------------------
 # Data Loading
 # ---------------------------------------------------------------------------
@@ -90,7 +106,11 @@ def make_uuid(seed: str) -> str:
 def load_csv_if_exists(path: Path) -> Optional[pd.DataFrame]:
     """Load a CSV file if it exists, otherwise return None."""
     if path.exists():
-        return pd.read_csv(path)
+        df = pd.read_csv(path)
+        for col in CATEGORY_COLUMNS.get(path.name, ()):
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        return df
     return None
 
 
@@ -152,15 +172,29 @@ def load_bdc_tables() -> dict[str, Optional[pd.DataFrame]]:
 # ---------------------------------------------------------------------------
 
 def add_source_column(df: Optional[pd.DataFrame], source: str) -> Optional[pd.DataFrame]:
-    """Add source column to dataframe if not already present."""
-    if df is None:
-        return None
+    """Add source column to dataframe if not already present.
+
+    Returns the input frame unchanged (not a copy) when it already has a source
+    column; otherwise returns a copy, so callers never see their frame mutated.
+    """
+    if df is None or "source" in df.columns:
+        return df
     df = df.copy()
-    if "source" not in df.columns:
-        df["source"] = source
+    df["source"] = source
     return df
 
 
+def concat_dedup(dfs: list[pd.DataFrame], key: str) -> pd.DataFrame:
+    """Concatenate frames and drop duplicate keys (first occurrence wins).
+
+    A single frame is deduplicated directly without going through pd.concat.
+    """
+    if not dfs:
+        return pd.DataFrame()
+    merged = dfs[0] if len(dfs) == 1 else pd.concat(dfs, ignore_index=True)
+    return merged.drop_duplicates(subset=[key], keep="first", ignore_index=True)
+
+
 def merge_funds(
     synthetic_funds: Optional[pd.DataFrame],
     bdc_funds: Optional[pd.DataFrame],
@@ -170,13 +204,8 @@ def merge_funds(
     bdc_funds = add_source_column(bdc_funds, SOURCE_BDC)
 
     dfs = [df for df in [synthetic_funds, bdc_funds] if df is not None]
-    if not dfs:
-        return pd.DataFrame()
-
-    merged = pd.concat(dfs, ignore_index=True)
     # Deduplicate by fund_id, keeping first occurrence
-    merged = merged.drop_duplicates(subset=["fund_id"], keep="first")
-    return merged
+    return concat_dedup(dfs, "fund_id")
 
 
 def merge_fund_reports(
@@ -188,53 +217,51 @@ def merge_fund_reports(
     bdc_reports = add_source_column(bdc_reports, SOURCE_BDC)
 
     dfs = [df for df in [synthetic_reports, bdc_reports] if df is not None]
-    if not dfs:
-        return pd.DataFrame()
-
-    merged = pd.concat(dfs, ignore_index=True)
     # Deduplicate by fund_report_id
-    merged = merged.drop_duplicates(subset=["fund_report_id"], keep="first")
-    return merged
+    return concat_dedup(dfs, "fund_report_id")
 
 
 def create_company_entries_for_bdc(
-    bdc_holdings: pd.DataFrame,
+    bdc_holdings: Optional[pd.DataFrame],
     existing_companies: Optional[pd.DataFrame],
 ) -> pd.DataFrame:
     """Create new dim_company entries for BDC holdings not already in dim_company."""
-    if bdc_holdings.empty:
+    if bdc_holdings is None or bdc_holdings.empty or "raw_company_name" not in bdc_holdings.columns:
         return pd.DataFrame()
 
+    created_at = pd.Timestamp.now().date().isoformat()
+
     # Get unique raw_company_names from BDC holdings
-    bdc_company_names = bdc_holdings["raw_company_name"].dropna().unique()
+    bdc_company_names = pd.Series(bdc_holdings["raw_company_name"].dropna().unique())
 
     # Get existing company names (case-insensitive matching)
-    existing_names = set()
+    existing_names = pd.Index([])
     if existing_companies is not None and not existing_companies.empty:
-        existing_names = set(
-            existing_companies["company_name"].str.lower().dropna().tolist()
+        existing_names = pd.Index(
+            existing_companies["company_name"].str.lower().dropna().unique()
         )
 
-    # Create entries for new companies
-    new_companies = []
-    for raw_name in bdc_company_names:
-        if raw_name.lower() not in existing_names:
-            company_id = make_uuid(f"bdc_company_{raw_name}")
-            new_companies.append({
-                "company_id": company_id,
-                "company_name": raw_name,
-                "primary_sector": None,  # Will be inferred from reported_sector if available
-                "primary_industry": None,
-                "primary_country": None,
-                "industry_taxonomy_node_id": None,
-                "country_taxonomy_node_id": None,
-                "website": None,
-                "created_at": pd.Timestamp.now().date().isoformat(),
-                "source": SOURCE_BDC,
-            })
-            existing_names.add(raw_name.lower())
-
-    return pd.DataFrame(new_companies)
+    # Keep names not already present, deduplicating case-insensitively among
+    # the BDC names themselves (first spelling wins)
+    bdc_lower = bdc_company_names.str.lower()
+    new_mask = ~bdc_lower.isin(existing_names) & ~bdc_lower.duplicated()
+    new_names = bdc_company_names[new_mask].tolist()
+    if not new_names:
+        return pd.DataFrame()
+
+    # Create entries for new companies in one shot
+    return pd.DataFrame({
+        "company_id": make_uuids(f"bdc_company_{name}" for name in new_names),
+        "company_name": new_names,
+        "primary_sector": None,  # Will be inferred from reported_sector if available
+        "primary_industry": None,
+        "primary_country": None,
+        "industry_taxonomy_node_id": None,
+        "country_taxonomy_node_id": None,
+        "website": None,
+        "created_at": created_at,
+        "source": SOURCE_BDC,
+    })
 
 
 def merge_companies(
@@ -260,13 +287,8 @@ def merge_companies(
         new_bdc_companies = create_company_entries_for_bdc(bdc_holdings, dedup_against)
 
     dfs = [df for df in [synthetic_companies, new_bdc_companies] if df is not None and not df.empty]
-    if not dfs:
-        return pd.DataFrame()
-
-    merged = pd.concat(dfs, ignore_index=True)
     # Deduplicate by company_id
-    merged = merged.drop_duplicates(subset=["company_id"], keep="first")
-    return merged
+    return concat_dedup(dfs, "company_id")
 
 
 def merge_holdings(
@@ -278,13 +300,8 @@ def merge_holdings(
     bdc_holdings = add_source_column(bdc_holdings, SOURCE_BDC)
 
     dfs = [df for df in [synthetic_holdings, bdc_holdings] if df is not None]
-    if not dfs:
-        return pd.DataFrame()
-
-    merged = pd.concat(dfs, ignore_index=True)
     # Deduplicate by reported_holding_id
-    merged = merged.drop_duplicates(subset=["reported_holding_id"], keep="first")
-    return merged
+    return concat_dedup(dfs, "reported_holding_id")
 
 
 def extract_bdc_sectors(bdc_holdings: Optional[pd.DataFrame]) -> list[str]:
@@ -313,40 +330,37 @@ def add_taxonomy_nodes_for_bdc_sectors(
         version_id = make_uuid("taxonomy_v1")
 
     # Get existing node names
-    existing_names = set()
+    existing_names = pd.Index([])
     if existing_nodes is not None and not existing_nodes.empty:
-        existing_names = set(existing_nodes["node_name"].str.lower().dropna().tolist())
-
-    # Create new nodes for BDC sectors/industries
-    new_nodes = []
-    for sector_name in bdc_sectors:
-        if sector_name.lower() not in existing_names:
-            node_id = make_uuid(f"bdc_sector_{sector_name}")
-            new_nodes.append({
-                "taxonomy_node_id": node_id,
-                "taxonomy_version_id": version_id,
-                "taxonomy_type": "industry",  # BDC reported_sector is typically industry-level
-                "node_name": sector_name,
-                "parent_node_id": None,  # Unknown parent sector
-                "path": f"/BDC/{sector_name}",
-                "level": 2,
-                "source": SOURCE_BDC,
-            })
-            existing_names.add(sector_name.lower())
-
-    if not new_nodes:
+        existing_names = pd.Index(existing_nodes["node_name"].str.lower().dropna().unique())
+
+    # Keep sectors not already present, deduplicating case-insensitively
+    sectors = pd.Series(bdc_sectors, dtype=object)
+    sectors_lower = sectors.str.lower()
+    new_mask = ~sectors_lower.isin(existing_names) & ~sectors_lower.duplicated()
+    new_sectors = sectors[new_mask].tolist()
+
+    if not new_sectors:
         return existing_nodes if existing_nodes is not None else pd.DataFrame()
 
-    new_nodes_df = pd.DataFrame(new_nodes)
+    # Create new nodes for BDC sectors/industries in one shot
+    new_nodes_df = pd.DataFrame({
+        "taxonomy_node_id": make_uuids(f"bdc_sector_{name}" for name in new_sectors),
+        "taxonomy_version_id": version_id,
+        "taxonomy_type": "industry",  # BDC reported_sector is typically industry-level
+        "node_name": new_sectors,
+        "parent_node_id": None,  # Unknown parent sector
+        "path": [f"/BDC/{name}" for name in new_sectors],
+        "level": 2,
+        "source": SOURCE_BDC,
+    })
 
     if existing_nodes is not None and not existing_nodes.empty:
         # Add source column to existing if not present
         if "source" not in existing_nodes.columns:
             existing_nodes = existing_nodes.copy()
             existing_nodes["source"] = SOURCE_SYNTHETIC
-        merged = pd.concat([existing_nodes, new_nodes_df], ignore_index=True)
-        merged = merged.drop_duplicates(subset=["taxonomy_node_id"], keep="first")
-        return merged
+        return concat_dedup([existing_nodes, new_nodes_df], "taxonomy_node_id")
 
     return new_nodes_df
 
@@ -10,19 +10,19 @@ import argparse
 import hashlib
 import logging
 import re
+import threading
 import uuid
-import warnings
-from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+import lxml.html
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
-
-# Suppress XML parsing warning - our BDC filings are HTML-ish
-warnings.filterwarnings("ignore", category=UserWarning, module="bs4")
+from lxml import etree
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -31,6 +31,8 @@ logger = logging.getLogger(__name__)
 # Constants
 BRONZE_DIR = Path("data/bronze/filings")
 SILVER_DIR = Path("data/silver")
+PARSE_CACHE_DIR = SILVER_DIR / ".parse_cache"
+PARSE_CACHE_VERSION = "2"  # Bump when parser changes should invalidate cached results
 EXTRACTION_METHOD = "html_table_parse"
 EXTRACTION_CONFIDENCE = 0.85
 
@@ -38,8 +40,158 @@ EXTRACTION_CONFIDENCE = 0.85
 # BDC holdings rarely exceed $5B; values above this are likely share counts
 MAX_REASONABLE_HOLDING_VALUE_USD = 5_000_000_000  # $5 billion
 
+# Text nodes that count as visible text (mirrors BeautifulSoup.get_text(), which
+# skips script/style/ruby-annotation/template strings); comments never match text()
+_TEXT_XPATH = etree.XPath(
+    ".//text()[not(parent::script or parent::style or parent::rt or parent::rp or ancestor::template)]",
+    smart_strings=False,
+)
+_TEXT_SKIP_PARENTS = frozenset({"script", "style", "rt", "rp"})
+
+# Precompiled patterns used in per-row hot paths
+_NUMERIC_STRIP_RE = re.compile(r"[^\d.\-]")
+_DATE_MY_RE = re.compile(r"^\d{1,2}/\d{4}$")
+_NUMERIC_ONLY_RE = re.compile(r"^[\d,.\-\$\(\)%\s]+$")
+_SUBTOTAL_RE = re.compile(r"^[\d,.\-\$\(\)\s—–]+$")
+_PCT_RE = re.compile(r"^\d+(?:\.\d+)?%$")
+_PCT_PREFIX_RE = re.compile(r"^\d+(?:\.\d+)?%")
+_DIGITS_COMMAS_RE = re.compile(r"^[\d,]+$")
+_ALPHA_START_RE = re.compile(r"^[a-zA-Z]")
+_FOOTNOTE_RE = re.compile(r"^\(\d+\)(\(\d+\))*$")
+_FOOTNOTE_STRIP_RE = re.compile(r"\s*\(\d+\)\s*")
+
+# str.translate table deleting everything clean_numeric drops: all non-numeric ASCII
+# plus the non-ASCII characters filings commonly put in value cells (nbsp, dashes,
+# currency symbols). Anything left that is not ASCII falls back to _NUMERIC_STRIP_RE.
+_NUMERIC_DELETE = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in "0123456789.-") + "\xa0\u200b–—−€£�"
+)
+
+# Exact-match cell values, checked with hashed set membership
+_DASH_NULLS = frozenset({"—", "–", "-", "−", "�", "", "$—", "$–", "$-"})  # dash variants meaning zero/null
+_CURRENCY_SYMBOLS = frozenset({"$", "€", "£", "A$"})
+
+# Denomination markers ("(in thousands)", "dollars in millions", ...), combined
+# into one alternation so the whole filing is scanned once; the named group
+# that matched tells which bucket it counts toward
+_DENOMINATION_RE = re.compile(
+    r"(?P<millions>"
+    r"\(in\s+millions?\)"
+    r"|amounts?\s+in\s+millions"
+    r"|dollars?\s+in\s+millions"
+    r"|\(\$\s*in\s+millions\)"
+    r")|(?P<thousands>"
+    r"\(in\s+thousands?\)"
+    r"|amounts?\s+in\s+thousands"
+    r"|dollars?\s+in\s+thousands"
+    r"|\(\s*\$\s*in\s*thousands\s*\)"
+    r")",
+    re.IGNORECASE,
+)
+
+# Schedule as-of date headers, with the month-day they map to
+_SCHEDULE_DATE_PATTERNS = [
+    (re.compile(r"december\s*31,?\s*(202\d)"), "12-31"),
+    (re.compile(r"september\s*30,?\s*(202\d)"), "09-30"),
+    (re.compile(r"june\s*30,?\s*(202\d)"), "06-30"),
+    (re.compile(r"march\s*31,?\s*(202\d)"), "03-31"),
+]
+
+_FUND_NAME_RE = re.compile(r"([A-Z][A-Z\s&]+(?:CORPORATION|CORP\.|INC\.|LLC|LP|CAPITAL|PARTNERS))")
+_FILENAME_YEAR_RE = re.compile(r"(\d{4})")
+_REPORT_DATE_PATTERNS = [
+    re.compile(r"December\s*31,\s*(\d{4})", re.IGNORECASE),
+    re.compile(r"(\d{4})-12-31", re.IGNORECASE),
+    re.compile(r"fiscal year ended.*?(\d{4})", re.IGNORECASE),
+]
+
+
+# One HTML parser per thread, reused across filings (lxml parsers must not be
+# shared between threads; worker processes each get their own)
+_PARSER_STATE = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """Return this thread's filing parser, creating it on first use."""
+    parser = getattr(_PARSER_STATE, "parser", None)
+    if parser is None:
+        parser = _PARSER_STATE.parser = lxml.html.HTMLParser(encoding="utf-8", huge_tree=True)
+    return parser
+
+
+def _parse_html(content: str | bytes) -> lxml.html.HtmlElement:
+    """Parse filing HTML into an lxml document tree.
+
+    Content is handed to lxml as UTF-8 bytes (raw file bytes are passed through
+    without a decode) because lxml rejects str input that carries an XML
+    encoding declaration, which inline XBRL filings usually do.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return lxml.html.document_fromstring(content, parser=_html_parser())
+
+
+def _text(element: lxml.html.HtmlElement) -> str:
+    """Return all visible text under an element, like BeautifulSoup's get_text()."""
+    return "".join(_TEXT_XPATH(element))
+
 
-def extract_fund_nav(html_content: str) -> Optional[float]:
+def _iter_text(element: lxml.html.HtmlElement) -> Iterator[str]:
+    """Lazily yield the text pieces _TEXT_XPATH selects, in document order.
+
+    Walks the tree with an explicit stack so a caller that stops early never
+    visits (or materializes text for) the rest of the document. Comments and
+    processing instructions contribute only their tails, as with text().
+    """
+    depth = sum(1 for _ in element.iterancestors("template"))
+    if element.text and not depth and element.tag not in _TEXT_SKIP_PARENTS and element.tag != "template":
+        yield element.text
+
+    # Frames: (element, child iterator, template depth inside it, emits its tail)
+    stack = [(element, iter(element), depth + (element.tag == "template"), False)]
+    while stack:
+        parent, children, parent_depth, emit_tail = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if emit_tail:
+                yield parent.tail
+            continue
+
+        # A tail is text in the parent; it follows the child's whole subtree
+        tail_visible = bool(child.tail) and not parent_depth and parent.tag not in _TEXT_SKIP_PARENTS
+        tag = child.tag
+        if not isinstance(tag, str):
+            if tail_visible:
+                yield child.tail
+            continue
+
+        child_depth = parent_depth + (tag == "template")
+        if child.text and not child_depth and tag not in _TEXT_SKIP_PARENTS:
+            yield child.text
+        stack.append((child, iter(child), child_depth, tail_visible))
+
+
+def _leading_text(element: lxml.html.HtmlElement, limit: int) -> str:
+    """Return _text(element)[:limit], joining only as many text pieces as needed."""
+    pieces = []
+    size = 0
+    for piece in _iter_text(element):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= limit:
+            break
+    return "".join(pieces)[:limit]
+
+
+def _stripped_text(element: lxml.html.HtmlElement) -> str:
+    """Return the stripped text pieces joined together, like get_text(strip=True)."""
+    return "".join(piece.strip() for piece in _TEXT_XPATH(element))
+
+
+def extract_fund_nav(
+    html_content: str, root: Optional[lxml.html.HtmlElement] = None, denomination: Optional[int] = None
+) -> Optional[float]:
     """Extract total net assets (NAV) from the Consolidated Balance Sheet.
 
     Searches for patterns like "Total net assets", "Total stockholders' equity",
@@ -51,21 +203,24 @@ def extract_fund_nav(html_content: str) -> Optional[float]:
 
     Args:
         html_content: Raw HTML content of the 10-K filing
+        root: Already-parsed document tree for html_content, to avoid re-parsing
+        denomination: Already-detected value multiplier, to avoid re-scanning html_content
 
     Returns:
         Total net assets in USD, or None if extraction fails
     """
-    soup = BeautifulSoup(html_content, "lxml")
+    if root is None:
+        root = _parse_html(html_content)
 
     # Detect denomination for the filing
-    denomination = detect_value_denomination(html_content)
+    if denomination is None:
+        denomination = detect_value_denomination(html_content)
 
     # Find ALL balance sheet tables (contain Total assets + Total liabilities + equity/net assets)
-    tables = soup.find_all("table")
     balance_sheet_tables = []
 
-    for table in tables:
-        text = table.get_text().lower()
+    for table in root.iter("table"):
+        text = _text(table).lower()
         if (
             "total assets" in text
             and "total liabilities" in text
@@ -96,16 +251,15 @@ def extract_fund_nav(html_content: str) -> Optional[float]:
     nav_candidates = []
 
     for table in balance_sheet_tables:
-        rows = table.find_all("tr")
+        rows = list(table.iter("tr"))
         for pattern in nav_patterns:
             for row in rows:
-                row_text = row.get_text().lower()
+                row_text = _text(row).lower()
                 # Match pattern but not "total liabilities and net assets"
                 if pattern in row_text and "liabilities and" not in row_text:
                     # Extract numeric values from this row
-                    cells = row.find_all(["td", "th"])
-                    for cell in cells:
-                        cell_text = cell.get_text(strip=True)
+                    for cell in row.iter("td", "th"):
+                        cell_text = _stripped_text(cell)
                         # Try to parse as a number
                         value = _parse_balance_sheet_value(cell_text)
                         if value is not None and value > 0:
@@ -175,25 +329,14 @@ def detect_value_denomination(content: str) -> int:
     We count occurrences and use the more frequent one, which is typically
     the Schedule of Investments denomination.
     """
-    text = content.lower()
-
-    # Count occurrences of each denomination pattern
-    millions_patterns = [
-        r"\(in\s+millions?\)",
-        r"amounts?\s+in\s+millions",
-        r"dollars?\s+in\s+millions",
-        r"\(\$\s*in\s+millions\)",
-    ]
-
-    thousands_patterns = [
-        r"\(in\s+thousands?\)",
-        r"amounts?\s+in\s+thousands",
-        r"dollars?\s+in\s+thousands",
-        r"\(\s*\$\s*in\s*thousands\s*\)",
-    ]
-
-    millions_count = sum(len(re.findall(p, text)) for p in millions_patterns)
-    thousands_count = sum(len(re.findall(p, text)) for p in thousands_patterns)
+    # Count occurrences of each denomination pattern (case-insensitive, single pass)
+    millions_count = 0
+    thousands_count = 0
+    for match in _DENOMINATION_RE.finditer(content):
+        if match.lastgroup == "millions":
+            millions_count += 1
+        else:
+            thousands_count += 1
 
     logger.debug(f"Denomination detection: millions={millions_count}, thousands={thousands_count}")
 
@@ -214,9 +357,12 @@ def detect_value_denomination(content: str) -> int:
         return 1_000_000
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedHolding:
-    """Intermediate representation of a holding extracted from HTML."""
+    """Intermediate representation of a holding extracted from HTML.
+
+    Slotted: filings produce thousands of these, so instances skip the per-object __dict__.
+    """
 
     company_name: str
     business_description: Optional[str]
@@ -230,16 +376,155 @@ class ParsedHolding:
     shares_units: Optional[str]
     row_number: int
     as_of_date: Optional[str] = None
+    # company_name.lower().strip(), computed once for the header filter and dedup keys
+    company_name_norm: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.company_name_norm = self.company_name.lower().strip()
 
 
 # Company names that indicate header rows, not actual holdings
-HEADER_COMPANY_NAMES = {
+HEADER_COMPANY_NAMES = frozenset({
     "company",
     "portfolio company",
     "issuer",
     "issuer name",
     "",
-}
+})
+
+# Leading rows of a table inspected for Schedule of Investments headers
+_HEADER_ROWS = 5
+
+# Substrings that mark a repeated column-header row: a company column AND a value column
+_HEADER_COMPANY_MARKERS = ("portfolio company", "company (1)", "thousands)company")  # last is OBDC
+_HEADER_VALUE_MARKERS = ("fair value", "amortized cost")
+
+# (table_index, table, is_flat_format) from find_schedule_of_investments_tables
+ScheduleTable = tuple[int, lxml.html.HtmlElement, bool]
+
+
+def _keyword_re(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile literal keywords into one alternation.
+
+    A single search then answers "does the text contain any of them" in one C-level
+    scan instead of one Python-level substring test per keyword.
+    """
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# Keyword vocabularies for row classification (matched against lowercased text)
+EQUITY_KEYWORDS = (
+    "common stock",
+    "common equity",
+    "common units",
+    "preferred stock",
+    "preferred equity",
+    "preferred units",
+    "preferred member",
+    "class a",
+    "class b",
+    "class c",
+    "warrants",
+    "warrant",
+    "member units",
+    "llc interest",
+    "llc equity",
+    "limited partnership",
+    "lp interest",
+    "equity interest",
+    "series a",
+    "series b",
+)
+SECTION_KEYWORDS = (
+    "control investments",
+    "affiliate investments",
+    "non-control/non-affiliate",
+    "non-affiliate investments",
+    "total investments",
+    "total control",
+    "total affiliate",
+    "subtotal",
+)
+# Investment types that mark a row as investment-only (not a company row)
+COMPANY_ROW_INVESTMENT_TYPES = (
+    # MAIN format
+    "secured debt",
+    "unsecured debt",
+    "subordinated",
+    "preferred",
+    "common stock",
+    "common equity",
+    "warrants",
+    "member units",
+    "llc interest",
+    "class a",
+    "class b",
+    # ARCC format
+    "first lien",
+    "second lien",
+    "senior secured",
+    "senior subordinated",
+    "junior secured",
+    "unitranche",
+    "mezzanine",
+    "limited partnership",
+    "llc equity",
+    "revolving",
+)
+FLAT_INVESTMENT_TYPES = (
+    "first lien",
+    "second lien",
+    "senior secured",
+    "unsecured",
+    "subordinated",
+    "mezzanine",
+    "equity",
+    "preferred",
+    "common",
+    "warrant",
+    "revolving",
+    "term loan",
+)
+INVESTMENT_TYPES = (
+    # MAIN format
+    "secured debt",
+    "unsecured debt",
+    "subordinated debt",
+    "subordinated note",
+    "preferred stock",
+    "preferred equity",
+    "preferred member",
+    "common stock",
+    "common equity",
+    "warrants",
+    "member units",
+    "llc interest",
+    "equity",
+    "debt",
+    "note",
+    "class a",
+    "class b",
+    # ARCC format
+    "first lien",
+    "second lien",
+    "senior secured",
+    "senior subordinated",
+    "junior secured",
+    "unitranche",
+    "mezzanine",
+    "limited partnership",
+    "llc equity",
+    "revolving",
+    # OBDC format
+    "unsecured facility",
+    "secured loan",
+    "term loan",
+)
+_EQUITY_RE = _keyword_re(EQUITY_KEYWORDS)
+_SECTION_RE = _keyword_re(SECTION_KEYWORDS)
+_COMPANY_ROW_INVESTMENT_TYPE_RE = _keyword_re(COMPANY_ROW_INVESTMENT_TYPES)
+_FLAT_INVESTMENT_TYPE_RE = _keyword_re(FLAT_INVESTMENT_TYPES)
+_INVESTMENT_TYPE_RE = _keyword_re(INVESTMENT_TYPES)
 
 
 def generate_deterministic_uuid(seed: str) -> str:
@@ -248,6 +533,13 @@ def generate_deterministic_uuid(seed: str) -> str:
     return str(uuid.UUID(bytes=hash_bytes))
 
 
+def generate_deterministic_uuids(seeds: Iterable[str]) -> list[str]:
+    """Generate deterministic UUIDs for many seeds (same values as generate_deterministic_uuid)."""
+    md5 = hashlib.md5
+    to_uuid = uuid.UUID
+    return [str(to_uuid(bytes=md5(seed.encode()).digest())) for seed in seeds]
+
+
 def clean_numeric(value: str) -> Optional[float]:
     """Clean and parse a numeric value from HTML text.
 
@@ -260,7 +552,7 @@ def clean_numeric(value: str) -> Optional[float]:
     cleaned = value.strip()
 
     # Handle em-dash, en-dash, or other dash variants meaning zero/null
-    if cleaned in ("—", "–", "-", "−", "�", "", "$—", "$–", "$-", "—"):
+    if cleaned in _DASH_NULLS:
         return None
 
     # Also check for single character non-numeric values
@@ -271,7 +563,9 @@ def clean_numeric(value: str) -> Optional[float]:
     is_negative = "(" in cleaned and ")" in cleaned
 
     # Remove non-numeric characters except decimal point and minus
-    cleaned = re.sub(r"[^\d.\-]", "", cleaned)
+    cleaned = cleaned.translate(_NUMERIC_DELETE)
+    if not cleaned.isascii():
+        cleaned = _NUMERIC_STRIP_RE.sub("", cleaned)
 
     if not cleaned or cleaned == "-" or cleaned == ".":
         return None
@@ -285,14 +579,21 @@ def clean_numeric(value: str) -> Optional[float]:
 
 def is_date_like(value: str) -> bool:
     """Check if a value looks like a date (MM/DD/YYYY or similar)."""
-    if not value:
+    if not value or "/" not in value:
         return False
+    # str.isdecimal() is exactly the regex \d class, without regex engine overhead
+    parts = value.strip().split("/")
     # Match patterns like 8/16/2029, 12/31/2024, etc.
-    if re.match(r"^\d{1,2}/\d{1,2}/\d{4}$", value.strip()):
-        return True
+    if len(parts) == 3:
+        month, day, year = parts
+        return (
+            0 < len(month) <= 2 and 0 < len(day) <= 2 and len(year) == 4
+            and month.isdecimal() and day.isdecimal() and year.isdecimal()
+        )
     # Also match MM/YYYY format (used for acquisition/maturity dates)
-    if re.match(r"^\d{1,2}/\d{4}$", value.strip()):
-        return True
+    if len(parts) == 2:
+        month, year = parts
+        return 0 < len(month) <= 2 and len(year) == 4 and month.isdecimal() and year.isdecimal()
     return False
 
 
@@ -304,59 +605,31 @@ def is_equity_investment(investment_type: str) -> bool:
     """
     if not investment_type:
         return False
-    inv_lower = investment_type.lower()
-    equity_keywords = [
-        "common stock",
-        "common equity",
-        "common units",
-        "preferred stock",
-        "preferred equity",
-        "preferred units",
-        "preferred member",
-        "class a",
-        "class b",
-        "class c",
-        "warrants",
-        "warrant",
-        "member units",
-        "llc interest",
-        "llc equity",
-        "limited partnership",
-        "lp interest",
-        "equity interest",
-        "series a",
-        "series b",
-    ]
-    return any(kw in inv_lower for kw in equity_keywords)
+    return _EQUITY_RE.search(investment_type.lower()) is not None
 
 
-def detect_schedule_date(table: Tag, soup: BeautifulSoup, content: str) -> Optional[str]:
+def detect_schedule_date(
+    table: lxml.html.HtmlElement, root: lxml.html.HtmlElement, content: str
+) -> Optional[str]:
     """Detect the as-of date for a schedule table by looking in the table content.
 
     Returns date in YYYY-MM-DD format or None if not found.
     """
     # Look for date in the table's text content (often in header rows)
-    table_text = table.get_text().lower()
+    table_text = _text(table).lower()
 
     # Look for "December 31, YYYY" pattern
-    date_patterns = [
-        (r"december\s*31,?\s*(202\d)", "12-31"),
-        (r"september\s*30,?\s*(202\d)", "09-30"),
-        (r"june\s*30,?\s*(202\d)", "06-30"),
-        (r"march\s*31,?\s*(202\d)", "03-31"),
-    ]
-
-    for pattern, month_day in date_patterns:
-        matches = list(re.finditer(pattern, table_text))
-        if matches:
+    for pattern, month_day in _SCHEDULE_DATE_PATTERNS:
+        match = pattern.search(table_text)
+        if match:
             # Use the first match found in the table
-            year = matches[0].group(1)
+            year = match.group(1)
             return f"{year}-{month_day}"
 
     return None
 
 
-def find_schedule_of_investments_tables(soup: BeautifulSoup) -> list[tuple[int, Tag]]:
+def find_schedule_of_investments_tables(root: lxml.html.HtmlElement) -> list[ScheduleTable]:
     """Find ALL tables that contain Schedule of Investments data.
 
     BDC filings typically have the schedule split across many tables (one per page).
@@ -365,15 +638,18 @@ def find_schedule_of_investments_tables(soup: BeautifulSoup) -> list[tuple[int,
     - ARCC: "Company", "Fair Value", "Amortized Cost"
     - OBDC: "($ in thousands)Company", "Industry", "Type of Investment", "Fair Value"
 
-    Returns list of (table_index, table) tuples to track position in document.
+    Returns list of (table_index, table, is_flat_format) tuples.
+    The index tracks position in the document; the OBDC flat-format flag is taken
+    from the header rows already walked here, so extraction need not re-walk them.
     """
     tables = []
-    all_tables = soup.find_all("table")
 
-    for i, table in enumerate(all_tables):
-        # Check first few rows for characteristic headers
-        rows = table.find_all("tr")[:5]
-        text = " ".join(row.get_text() for row in rows).lower()
+    for i, table in enumerate(root.iter("table")):
+        # Check first few rows for characteristic headers. Only the header region is
+        # walked, so non-schedule tables cost O(header) rather than O(table).
+        rows = list(islice(table.iter("tr"), _HEADER_ROWS))
+        first_rows_text = " ".join(_text(row) for row in rows[:3]).lower()
+        text = " ".join([first_rows_text, *(_text(row).lower() for row in rows[3:])])
 
         # Check for various header patterns used by different BDCs
         has_company_col = (
@@ -385,65 +661,23 @@ def find_schedule_of_investments_tables(soup: BeautifulSoup) -> list[tuple[int,
 
         if has_company_col and has_value_col:
             # Additional check: must have some actual data rows
-            if len(table.find_all("tr")) > 3:
-                tables.append((i, table))
+            if len(rows) > 3:
+                tables.append((i, table, _is_flat_format(first_rows_text)))
 
     return tables
 
 
 def filter_current_year_tables(
-    tables: list[tuple[int, Tag]], report_year: int, content: str
-) -> list[Tag]:
+    tables: list[ScheduleTable], report_year: int, content: str
+) -> list[ScheduleTable]:
     """Filter schedule tables to only include current year (not prior year comparative).
 
     10-K filings often include comparative schedules for both current and prior year.
-    We only want to parse the current year data to avoid duplicates.
-
-    Strategy: Find where prior year schedule starts by looking for "December 31, {prior_year}"
-    and exclude tables after that point.
+    Locating where the prior year schedule starts (e.g. "December 31, {report_year - 1}")
+    is not reliable enough to cut tables on, so all tables are kept and prior year
+    duplicates are removed after parsing by deduplicate_holdings.
     """
-    if not tables:
-        return []
-
-    prior_year = report_year - 1
-
-    # Find the position of prior year schedule header in the HTML
-    # Look for patterns like "As of December 31, 2024" or "December 31, 2024"
-    prior_year_patterns = [
-        f"as of december 31, {prior_year}",
-        f"december 31, {prior_year}",
-        f"as of december 31,{prior_year}",
-    ]
-
-    content_lower = content.lower()
-    prior_year_positions = []
-
-    for pattern in prior_year_patterns:
-        pos = 0
-        while True:
-            pos = content_lower.find(pattern, pos)
-            if pos == -1:
-                break
-            prior_year_positions.append(pos)
-            pos += 1
-
-    if not prior_year_positions:
-        # No prior year schedule found - use all tables
-        return [table for _, table in tables]
-
-    # Find the minimum position where prior year appears after some schedule tables
-    # This indicates the start of the comparative schedule
-    min_table_index = tables[0][0]
-    max_table_index = tables[-1][0]
-
-    # Estimate that prior year schedule starts around halfway through
-    # If there are explicit headers, use them
-    # For now, use a simple heuristic: take roughly first half of tables
-    # This is imperfect but better than taking all duplicates
-
-    # Better approach: deduplicate by company+investment_type after parsing
-    # For now, return all tables and we'll deduplicate later
-    return [table for _, table in tables]
+    return list(tables)
 
 
 def deduplicate_holdings(holdings: list[ParsedHolding]) -> list[ParsedHolding]:
@@ -460,31 +694,30 @@ def deduplicate_holdings(holdings: list[ParsedHolding]) -> list[ParsedHolding]:
     The alternative of using only (company, type) as key incorrectly removes
     multiple tranches of the same loan type, which is common in BDC portfolios.
     """
-    seen = set()
-    unique_holdings = []
-
-    for holding in holdings:
-        # Create a key that identifies unique holdings
-        # Include fair_value to preserve multiple tranches with different values
-        # Round fair_value to reduce false positives from minor changes
-        rounded_value = round(holding.fair_value, -1) if holding.fair_value else None
-
-        key = (
-            holding.company_name.lower().strip(),
-            (holding.investment_type or "").lower().strip(),
-            rounded_value,
+    # Create a key that identifies unique holdings
+    # Include fair_value to preserve multiple tranches with different values
+    # Round fair_value to reduce false positives from minor changes
+    keys = [
+        (
+            h.company_name_norm,
+            (h.investment_type or "").lower().strip(),
+            round(h.fair_value, -1) if h.fair_value else None,
         )
+        for h in holdings
+    ]
 
-        if key not in seen:
-            seen.add(key)
-            unique_holdings.append(holding)
+    # dict keeps the first index seen for each key, in first-seen order
+    first_index: dict[tuple, int] = {}
+    setdefault = first_index.setdefault
+    for i, key in enumerate(keys):
+        setdefault(key, i)
 
-    return unique_holdings
+    return [holdings[i] for i in first_index.values()]
 
 
 def extract_holdings_from_table(
-    table: Tag, current_company: str, current_description: str, start_row_number: int,
-    as_of_date: Optional[str] = None
+    table: lxml.html.HtmlElement, current_company: str, current_description: str, start_row_number: int,
+    as_of_date: Optional[str] = None, is_flat_format: Optional[bool] = None
 ) -> tuple[list[ParsedHolding], str, str, int]:
     """Extract holdings from a Schedule of Investments table.
 
@@ -494,97 +727,121 @@ def extract_holdings_from_table(
     1. MAIN format: Company row, then separate investment detail rows
     2. ARCC format: Company + investment on same row
     3. OBDC format: Flat rows where each row is a complete holding (company + industry + investment + values)
+
+    is_flat_format may be passed from find_schedule_of_investments_tables; when
+    omitted it is detected from the table's first rows.
     """
-    holdings = []
-    rows = table.find_all("tr")
-    row_number = start_row_number
+    rows = list(table.iter("tr"))
+
+    if is_flat_format is None:
+        is_flat_format = _is_flat_format(" ".join(_text(row) for row in rows[:3]).lower())
+
+    # Flat tables carry no company context, so it passes through unchanged
+    if is_flat_format:
+        holdings, row_number = _extract_flat(rows, start_row_number, as_of_date)
+        return holdings, current_company, current_description, row_number
+
+    return _extract_hierarchical(rows, current_company, current_description, start_row_number, as_of_date)
+
+
+def _is_flat_format(first_rows_text: str) -> bool:
+    """Detect OBDC-style flat format (header contains "Industry" as separate column)."""
+    return "industry" in first_rows_text and "type of investment" in first_rows_text
+
+
+def _is_header_row(row_text: str) -> bool:
+    """Check if row repeats the column headers ("Portfolio Company"/"Company", "Fair Value", etc.)."""
+    # Every company marker contains "company", so one substring test clears data rows
+    return (
+        "company" in row_text
+        and any(marker in row_text for marker in _HEADER_COMPANY_MARKERS)
+        and any(marker in row_text for marker in _HEADER_VALUE_MARKERS)
+    )
 
-    # Detect OBDC-style flat format (header contains "Industry" as separate column)
-    first_rows_text = " ".join(row.get_text() for row in rows[:3]).lower()
-    is_flat_format = "industry" in first_rows_text and "type of investment" in first_rows_text
 
+def _iter_data_rows(rows: list[lxml.html.HtmlElement]) -> Iterator[tuple[list[str], str]]:
+    """Yield (cell_texts, row_text) for rows that are not empty, header, section or subtotal rows."""
     for row in rows:
-        cells = row.find_all(["td", "th"])
-        cell_texts = [cell.get_text(strip=True) for cell in cells]
+        cell_texts = [_stripped_text(cell) for cell in row.iter("td", "th")]
 
-        # Skip completely empty rows
-        non_empty = [t for t in cell_texts if t]
-        if not non_empty:
+        # Skip completely empty rows (cell texts are already stripped)
+        filled = len(cell_texts) - cell_texts.count("")
+        if not filled:
             continue
 
-        # Skip header rows (contain "Portfolio Company"/"Company", "Fair Value", etc.)
         row_text = " ".join(cell_texts).lower()
-        is_header = (
-            (
-                "portfolio company" in row_text
-                or "company (1)" in row_text
-                or "thousands)company" in row_text  # OBDC format
-            )
-            and ("fair value" in row_text or "amortized cost" in row_text)
-        )
-        if is_header:
+        if _is_header_row(row_text):
             continue
 
         # Skip section headers like "Control Investments", "Affiliate Investments"
-        if is_section_header(cell_texts):
+        if is_section_header(cell_texts, row_text):
             continue
 
-        # Detect subtotal rows (just numbers in last few columns)
-        if is_subtotal_row(cell_texts):
+        # Detect subtotal rows (just numbers in last few columns); data rows with
+        # more than three filled cells can never qualify, so skip the check for them
+        if filled <= 3 and is_subtotal_row(cell_texts):
             continue
 
-        # For flat format (OBDC), extract company + investment from same row
-        if is_flat_format:
-            holding = try_extract_flat_holding(cell_texts, row_number, as_of_date)
-            if holding:
-                holdings.append(holding)
-                row_number += 1
-            continue
+        yield cell_texts, row_text
+
+
+def _extract_flat(
+    rows: list[lxml.html.HtmlElement], start_row_number: int, as_of_date: Optional[str]
+) -> tuple[list[ParsedHolding], int]:
+    """Extract holdings from a flat-format (OBDC) table: company + investment on every row."""
+    holdings = []
+    row_number = start_row_number
+
+    for cell_texts, _ in _iter_data_rows(rows):
+        holding = try_extract_flat_holding(cell_texts, row_number, as_of_date)
+        if holding:
+            holdings.append(holding)
+            row_number += 1
+
+    return holdings, row_number
 
-        # For hierarchical format (MAIN/ARCC):
+
+def _extract_hierarchical(
+    rows: list[lxml.html.HtmlElement], current_company: str, current_description: str,
+    start_row_number: int, as_of_date: Optional[str]
+) -> tuple[list[ParsedHolding], str, str, int]:
+    """Extract holdings from a hierarchical-format (MAIN/ARCC) table."""
+    holdings = []
+    row_number = start_row_number
+
+    for cell_texts, row_text in _iter_data_rows(rows):
         # Detect company name rows
-        company_info = try_extract_company_info(cell_texts)
+        company_info = try_extract_company_info(cell_texts, row_text)
         if company_info:
             current_company, current_description = company_info
             # In ARCC format, company + investment are on same row
             # Try to also extract investment from this row
-            holding = try_extract_investment(
-                cell_texts, current_company, current_description, row_number, as_of_date
-            )
-            if holding:
-                holdings.append(holding)
-                row_number += 1
+        elif not current_company:
             continue
 
-        # Try to extract investment details (continuation rows)
-        if current_company:
-            holding = try_extract_investment(
-                cell_texts, current_company, current_description, row_number, as_of_date
-            )
-            if holding:
-                holdings.append(holding)
-                row_number += 1
+        # Try to extract investment details (company row or continuation rows)
+        holding = try_extract_investment(
+            cell_texts, current_company, current_description, row_number, as_of_date
+        )
+        if holding:
+            holdings.append(holding)
+            row_number += 1
 
     return holdings, current_company, current_description, row_number
 
 
-def is_section_header(cell_texts: list[str]) -> bool:
-    """Check if row is a section header like 'Control Investments'."""
-    text = " ".join(cell_texts).lower()
-    section_keywords = [
-        "control investments",
-        "affiliate investments",
-        "non-control/non-affiliate",
-        "non-affiliate investments",
-        "total investments",
-        "total control",
-        "total affiliate",
-        "subtotal",
-    ]
-    return any(kw in text for kw in section_keywords)
+def is_section_header(cell_texts: list[str], row_text: Optional[str] = None) -> bool:
+    """Check if row is a section header like 'Control Investments'.
 
+    row_text may be passed when the caller already has " ".join(cell_texts).lower().
+    """
+    text = row_text if row_text is not None else " ".join(cell_texts).lower()
+    return _SECTION_RE.search(text) is not None
 
-def try_extract_company_info(cell_texts: list[str]) -> Optional[tuple[str, Optional[str]]]:
+
+def try_extract_company_info(
+    cell_texts: list[str], row_text: Optional[str] = None
+) -> Optional[tuple[str, Optional[str]]]:
     """Try to extract company name and description from a row.
 
     Handles two formats:
@@ -595,56 +852,33 @@ def try_extract_company_info(cell_texts: list[str]) -> Optional[tuple[str, Optio
     - Company name in one of the first few cells
     - Often a business description nearby
     - NOT purely numeric values
+
+    row_text may be passed when the caller already has " ".join(cell_texts).lower().
     """
-    # Filter to non-empty cells
-    non_empty = [(i, t) for i, t in enumerate(cell_texts) if t.strip()]
+    # Filter to non-empty cells, stripping and lowercasing each one only once
+    stripped = ((i, t.strip()) for i, t in enumerate(cell_texts))
+    non_empty = [(i, t, t.lower()) for i, t in stripped if t]
 
     if not non_empty:
         return None
 
-    # Investment type keywords
-    investment_types = [
-        # MAIN format
-        "secured debt",
-        "unsecured debt",
-        "subordinated",
-        "preferred",
-        "common stock",
-        "common equity",
-        "warrants",
-        "member units",
-        "llc interest",
-        "class a",
-        "class b",
-        # ARCC format
-        "first lien",
-        "second lien",
-        "senior secured",
-        "senior subordinated",
-        "junior secured",
-        "unitranche",
-        "mezzanine",
-        "limited partnership",
-        "llc equity",
-        "revolving",
-    ]
-
-    row_text = " ".join(cell_texts).lower()
-    has_investment_type = any(inv_type in row_text for inv_type in investment_types)
+    if row_text is None:
+        row_text = " ".join(cell_texts).lower()
+    has_investment_type = _COMPANY_ROW_INVESTMENT_TYPE_RE.search(row_text) is not None
 
     # For MAIN-style format: company rows don't have investment types
     # For ARCC-style format: company + investment are on same row
     # We distinguish by checking if the FIRST non-empty cell looks like a company name
 
-    first_cell_text = non_empty[0][1].strip() if non_empty else ""
+    _, first_cell_text, first_cell_lower = non_empty[0]
 
     # Check if first cell looks like a company name (not investment type, not numeric)
     first_cell_is_company = (
         len(first_cell_text) > 4
-        and not re.match(r"^[\d,.\-\$\(\)%\s]+$", first_cell_text)
+        and not _NUMERIC_ONLY_RE.match(first_cell_text)
         and not is_date_like(first_cell_text)
-        and not any(inv_type in first_cell_text.lower() for inv_type in investment_types)
-        and not first_cell_text.lower().startswith(("total", "subtotal"))
+        and not _COMPANY_ROW_INVESTMENT_TYPE_RE.search(first_cell_lower)
+        and not first_cell_lower.startswith(("total", "subtotal"))
     )
 
     if has_investment_type and not first_cell_is_company:
@@ -652,11 +886,9 @@ def try_extract_company_info(cell_texts: list[str]) -> Optional[tuple[str, Optio
         return None
 
     # Look for company name pattern in first cells
-    for idx, text in non_empty[:3]:
-        text = text.strip()
-
+    for idx, text, text_lower in non_empty[:3]:
         # Skip purely numeric
-        if re.match(r"^[\d,.\-\$\(\)%\s]+$", text):
+        if _NUMERIC_ONLY_RE.match(text):
             continue
 
         # Skip short strings (footnotes like "(10)")
@@ -668,23 +900,22 @@ def try_extract_company_info(cell_texts: list[str]) -> Optional[tuple[str, Optio
             continue
 
         # Skip investment type keywords in first position
-        if any(inv_type in text.lower() for inv_type in investment_types):
+        if _COMPANY_ROW_INVESTMENT_TYPE_RE.search(text_lower):
             continue
 
         # This looks like a company name
-        company = re.sub(r"\s*\(\d+\)\s*", " ", text).strip()  # Remove footnote markers
+        company = _FOOTNOTE_STRIP_RE.sub(" ", text).strip()  # Remove footnote markers
 
         # Try to find description in nearby cell
         description = None
-        for desc_idx, desc_text in non_empty:
-            if desc_idx != idx and desc_idx > idx:
-                desc_text = desc_text.strip()
+        for desc_idx, desc_text, desc_lower in non_empty:
+            if desc_idx > idx:
                 # Skip investment types as descriptions
-                if any(inv_type in desc_text.lower() for inv_type in investment_types):
+                if _COMPANY_ROW_INVESTMENT_TYPE_RE.search(desc_lower):
                     continue
                 if (
                     len(desc_text) > 5
-                    and not re.match(r"^[\d,.\-\$\(\)%\s]+$", desc_text)
+                    and not _NUMERIC_ONLY_RE.match(desc_text)
                     and not is_date_like(desc_text)
                 ):
                     description = desc_text
@@ -697,18 +928,15 @@ def try_extract_company_info(cell_texts: list[str]) -> Optional[tuple[str, Optio
 
 def is_subtotal_row(cell_texts: list[str]) -> bool:
     """Check if row is a subtotal row (just has 1-2 numbers, no text)."""
-    non_empty = [t.strip() for t in cell_texts if t.strip()]
+    non_empty = [t for t in map(str.strip, cell_texts) if t]
 
-    if len(non_empty) > 3:
+    if not non_empty or len(non_empty) > 3:
         return False
 
     # All non-empty should be numeric-looking
-    for text in non_empty:
-        # Allow numbers, commas, dollar signs, parens, dashes
-        if not re.match(r"^[\d,.\-\$\(\)\s—–]+$", text):
-            return False
-
-    return len(non_empty) >= 1
+    # Allow numbers, commas, dollar signs, parens, dashes
+    subtotal_match = _SUBTOTAL_RE.match
+    return all(subtotal_match(text) for text in non_empty)
 
 
 def try_extract_flat_holding(
@@ -730,13 +958,13 @@ def try_extract_flat_holding(
     first_cell = non_empty[0][1] if non_empty else ""
 
     # Skip if first cell is numeric or looks like a header
-    if re.match(r"^[\d,.\-\$\(\)%\s]+$", first_cell):
+    if _NUMERIC_ONLY_RE.match(first_cell):
         return None
     if len(first_cell) < 3:
         return None
 
     # Extract company name (remove footnote markers and truncated address)
-    company_name = re.sub(r"\s*\(\d+\)\s*", " ", first_cell).strip()
+    company_name = _FOOTNOTE_STRIP_RE.sub(" ", first_cell).strip()
     # Truncate at common address patterns
     for pattern in [" LLC ", " Inc. ", " Corp. ", " LP ", " Ltd "]:
         if pattern in company_name:
@@ -748,33 +976,14 @@ def try_extract_flat_holding(
     industry = None
     if len(non_empty) > 1:
         ind_text = non_empty[1][1]
-        if not re.match(r"^[\d,.\-\$\(\)%\s]+$", ind_text) and len(ind_text) > 2:
+        if not _NUMERIC_ONLY_RE.match(ind_text) and len(ind_text) > 2:
             industry = ind_text
 
     # Look for investment type
     investment_type = None
-    investment_types = [
-        "first lien",
-        "second lien",
-        "senior secured",
-        "unsecured",
-        "subordinated",
-        "mezzanine",
-        "equity",
-        "preferred",
-        "common",
-        "warrant",
-        "revolving",
-        "term loan",
-    ]
-
     for idx, text in non_empty:
-        text_lower = text.lower()
-        for inv_type in investment_types:
-            if inv_type in text_lower:
-                investment_type = text
-                break
-        if investment_type:
+        if _FLAT_INVESTMENT_TYPE_RE.search(text.lower()):
+            investment_type = text
             break
 
     if not investment_type:
@@ -787,22 +996,22 @@ def try_extract_flat_holding(
 
     for idx, text in non_empty:
         # Date patterns: MM/YYYY or M/YYYY
-        if re.match(r"^\d{1,2}/\d{4}$", text):
+        if _DATE_MY_RE.match(text):
             if maturity_date is None:
                 maturity_date = text
-        elif re.match(r"^\d+\.\d+%", text) or re.match(r"^\d+%", text):
+        elif _PCT_PREFIX_RE.match(text):
             interest_rate = text
 
     # Extract numeric values from the end
     numeric_values = []
     for idx, text in reversed(non_empty):
-        if re.match(r"^\d{1,2}/\d{4}$", text):  # Skip date
+        if _DATE_MY_RE.match(text):  # Skip date
             continue
         if "%" in text:  # Skip percentage
             continue
-        if re.match(r"^[a-zA-Z]", text) and text not in ("$", "€", "£", "A$"):
+        if _ALPHA_START_RE.match(text) and text not in _CURRENCY_SYMBOLS:
             continue
-        if re.match(r"^\(\d+\)(\(\d+\))*$", text):  # Skip footnotes
+        if _FOOTNOTE_RE.match(text):  # Skip footnotes
             continue
 
         val = clean_numeric(text)
@@ -860,49 +1069,9 @@ def try_extract_investment(
 
     # Check for investment type
     investment_type = None
-    investment_types = [
-        # MAIN format
-        "secured debt",
-        "unsecured debt",
-        "subordinated debt",
-        "subordinated note",
-        "preferred stock",
-        "preferred equity",
-        "preferred member",
-        "common stock",
-        "common equity",
-        "warrants",
-        "member units",
-        "llc interest",
-        "equity",
-        "debt",
-        "note",
-        "class a",
-        "class b",
-        # ARCC format
-        "first lien",
-        "second lien",
-        "senior secured",
-        "senior subordinated",
-        "junior secured",
-        "unitranche",
-        "mezzanine",
-        "limited partnership",
-        "llc equity",
-        "revolving",
-        # OBDC format
-        "unsecured facility",
-        "secured loan",
-        "term loan",
-    ]
-
     for idx, text in non_empty:
-        text_lower = text.lower()
-        for inv_type in investment_types:
-            if inv_type in text_lower:
-                investment_type = re.sub(r"\s*\(\d+\)\s*", " ", text).strip()
-                break
-        if investment_type:
+        if _INVESTMENT_TYPE_RE.search(text.lower()):
+            investment_type = _FOOTNOTE_STRIP_RE.sub(" ", text).strip()
             break
 
     if not investment_type:
@@ -920,9 +1089,9 @@ def try_extract_investment(
                 investment_date = text
             else:
                 maturity_date = text
-        elif re.match(r"^\d+\.\d+%$", text) or re.match(r"^\d+%$", text):
+        elif _PCT_RE.match(text):
             interest_rate = text
-        elif re.match(r"^[\d,]+$", text) and len(text) > 2:
+        elif _DIGITS_COMMAS_RE.match(text) and len(text) > 2:
             # Could be shares/units or a value - check position
             # Shares usually appear before the financial values
             pass
@@ -939,10 +1108,10 @@ def try_extract_investment(
         if "%" in text:
             continue
         # Skip text values (but allow $ which precedes numbers)
-        if re.match(r"^[a-zA-Z]", text) and text != "$":
+        if _ALPHA_START_RE.match(text) and text != "$":
             continue
         # Skip footnote references like (2)(9), (13), etc.
-        if re.match(r"^\(\d+\)(\(\d+\))*$", text):
+        if _FOOTNOTE_RE.match(text):
             continue
         # Skip SOFR references
         if "SOFR" in text:
@@ -991,11 +1160,15 @@ def try_extract_investment(
     )
 
 
-def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def parse_bdc_filing(
+    filename: str, use_cache: bool = False
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Parse a BDC 10-K filing and extract holdings.
 
     Args:
         filename: Name of the HTML file in data/bronze/filings/
+        use_cache: Reuse (and store) results in PARSE_CACHE_DIR, keyed by a hash of
+            the filing bytes, so an unchanged filing is only parsed once
 
     Returns:
         Tuple of (holdings_df, fund_df, fund_report_df)
@@ -1006,27 +1179,58 @@ def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
 
     logger.info(f"Parsing BDC filing: {filename}")
 
-    # Read and parse HTML
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(filepath, "rb") as f:
+        content_bytes = f.read()
+
+    if not use_cache:
+        return _parse_filing_content(filename, content_bytes)
+
+    cache_path = PARSE_CACHE_DIR / f"{_parse_cache_key(filename, content_bytes)}.pkl"
+    if cache_path.exists():
+        logger.info(f"Using cached parse: {cache_path}")
+        return pd.read_pickle(cache_path)
+
+    result = _parse_filing_content(filename, content_bytes)
+    PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    pd.to_pickle(result, cache_path)
+    return result
+
+
+def _parse_cache_key(filename: str, content_bytes: bytes) -> str:
+    """Hash the filing bytes together with everything else that shapes the parse output."""
+    digest = hashlib.blake2b(digest_size=16)
+    # The filename feeds the report id and report date, so it is part of the key
+    for part in (PARSE_CACHE_VERSION.encode(), filename.encode(), b"\0", content_bytes):
+        digest.update(part)
+    return digest.hexdigest()
 
-    soup = BeautifulSoup(content, "lxml")
+
+def _parse_filing_content(
+    filename: str, content_bytes: bytes
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Parse the raw bytes of a BDC filing (see parse_bdc_filing)."""
+    # Parse HTML straight from bytes; the decoded text is only needed
+    # for the denomination/date regex scans over the raw document
+    root = _parse_html(content_bytes)
+    content = content_bytes.decode("utf-8", errors="replace")
 
     # Detect value denomination (thousands vs millions)
     value_multiplier = detect_value_denomination(content)
     logger.info(f"Detected value denomination: {'millions' if value_multiplier == 1_000_000 else 'thousands'}")
 
     # Extract fund name from filename or document
-    fund_name = extract_fund_name(soup, filename)
+    # Both look only at the start of the document, so its text is gathered once
+    head_text = _leading_text(root, 10000)
+    fund_name = extract_fund_name(root, filename, head_text)
     logger.info(f"Detected fund: {fund_name}")
 
     # Extract report date (this is the current year's date)
-    report_date = extract_report_date(soup, filename)
+    report_date = extract_report_date(root, filename, head_text)
     report_year = int(report_date[:4])
     logger.info(f"Report date: {report_date}")
 
     # Find ALL schedule of investments tables
-    tables = find_schedule_of_investments_tables(soup)
+    tables = find_schedule_of_investments_tables(root)
     logger.info(f"Found {len(tables)} Schedule of Investments tables")
 
     # Filter tables to current year only (skip prior year comparative schedules)
@@ -1040,15 +1244,15 @@ def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
     current_description = None
     row_number = 1
 
-    for i, table in enumerate(current_year_tables):
+    for i, (_, table, is_flat_format) in enumerate(current_year_tables):
         # Detect the as-of date for this table by looking at table content
         # Default to report_date if not found
-        table_date = detect_schedule_date(table, soup, content) or report_date
+        table_date = detect_schedule_date(table, root, content) or report_date
         if table_date != report_date:
             logger.debug(f"  Table {i + 1}: detected date {table_date}")
 
         holdings, current_company, current_description, row_number = extract_holdings_from_table(
-            table, current_company, current_description, row_number, table_date
+            table, current_company, current_description, row_number, table_date, is_flat_format
         )
         if holdings:
             logger.info(f"  Table {i + 1}: extracted {len(holdings)} holdings")
@@ -1059,7 +1263,7 @@ def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
     # Filter out header rows that were incorrectly parsed as holdings
     header_filtered = [
         h for h in all_holdings
-        if h.company_name.lower().strip() not in HEADER_COMPANY_NAMES
+        if h.company_name_norm not in HEADER_COMPANY_NAMES
     ]
     if len(header_filtered) < len(all_holdings):
         logger.info(f"Filtered {len(all_holdings) - len(header_filtered)} header rows")
@@ -1077,8 +1281,7 @@ def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
         logger.warning("No holdings extracted from filing!")
 
     # Generate IDs
-    fund_id = generate_deterministic_uuid(f"bdc-{fund_name}")
-    fund_report_id = generate_deterministic_uuid(f"bdc-report-{filename}")
+    fund_id, fund_report_id = generate_deterministic_uuids([f"bdc-{fund_name}", f"bdc-report-{filename}"])
 
     # Create fund record
     fund_df = pd.DataFrame(
@@ -1095,13 +1298,35 @@ def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
         ]
     )
 
+    # Create holdings records, filtering out invalid values
+    # Apply detected denomination multiplier to convert to actual USD (zero/missing -> null)
+    fair_values = np.array([h.fair_value for h in all_holdings], dtype="float64")  # None -> NaN
+    fair_value_usd = np.where(fair_values != 0, fair_values, np.nan) * value_multiplier
+
+    # Sanity check: fair value should be reasonable (not a share count)
+    # Values > $5B are likely share counts being misidentified
+    unreasonable = fair_value_usd > MAX_REASONABLE_HOLDING_VALUE_USD
+    skipped_count = int(unreasonable.sum())
+    if skipped_count > 0:
+        if logger.isEnabledFor(logging.DEBUG):
+            # Only the rejected rows are visited and formatted
+            for i in np.flatnonzero(unreasonable):
+                logger.debug(
+                    f"Skipping holding with unreasonable value ${fair_value_usd[i]/1e9:.1f}B: "
+                    f"{all_holdings[i].company_name[:40]}"
+                )
+        all_holdings = [h for h, skip in zip(all_holdings, unreasonable) if not skip]
+        fair_value_usd = fair_value_usd[~unreasonable]
+        logger.info(f"Skipped {skipped_count} holdings with unreasonable values (likely share counts)")
+
     # Create fund report record
     # Try to extract actual NAV from balance sheet first
-    nav_usd = extract_fund_nav(content)
+    nav_usd = extract_fund_nav(content, root=root, denomination=value_multiplier)
 
     if nav_usd is None:
-        # Fall back to computing NAV from sum of fair values (approximate)
-        total_fair_value = sum(h.fair_value for h in all_holdings if h.fair_value) * value_multiplier
+        # Fall back to computing NAV from sum of fair values (approximate), using the
+        # same scaled values as the holdings so rejected share counts are not counted
+        total_fair_value = float(np.nansum(fair_value_usd))
         logger.warning(
             f"Could not extract NAV from balance sheet, falling back to sum of fair values: "
             f"${total_fair_value:,.0f}"
@@ -1122,90 +1347,109 @@ def parse_bdc_filing(filename: str) -> tuple[pd.DataFrame, pd.DataFrame, pd.Data
         ]
     )
 
-    # Create holdings records, filtering out invalid values
-    holdings_records = []
-    skipped_count = 0
-    for holding in all_holdings:
-        # Apply detected denomination multiplier to convert to actual USD
-        fair_value_usd = holding.fair_value * value_multiplier if holding.fair_value else None
-
-        # Sanity check: fair value should be reasonable (not a share count)
-        # Values > $5B are likely share counts being misidentified
-        if fair_value_usd and fair_value_usd > MAX_REASONABLE_HOLDING_VALUE_USD:
-            logger.debug(
-                f"Skipping holding with unreasonable value ${fair_value_usd/1e9:.1f}B: "
-                f"{holding.company_name[:40]}"
-            )
-            skipped_count += 1
-            continue
+    holdings_df = pd.DataFrame(
+        {
+            # Deterministic ids: re-parsing a filing yields the same ids, so silver appends replace rows
+            "reported_holding_id": generate_deterministic_uuids(
+                f"bdc-holding-{fund_report_id}-{h.row_number}-{h.company_name}" for h in all_holdings
+            ),
+            "fund_report_id": fund_report_id,
+            "company_id": None,  # Will be resolved by entity resolution
+            "raw_company_name": [h.company_name for h in all_holdings],
+            # Low-cardinality text columns are categorical: one small code array
+            # per column instead of a Python string per row
+            "reported_sector": pd.Categorical([h.business_description for h in all_holdings]),  # Business description as sector
+            "reported_country": None,  # BDC filings rarely include country
+            "reported_value_usd": fair_value_usd,
+            "reported_pct_nav": None,  # Can be computed later
+            "extraction_method": pd.Categorical([EXTRACTION_METHOD] * len(all_holdings)),
+            "extraction_confidence": EXTRACTION_CONFIDENCE,
+            "document_id": None,
+            "page_number": None,
+            "row_number": np.fromiter((h.row_number for h in all_holdings), dtype="int64", count=len(all_holdings)),
+            "as_of_date": pd.Categorical([h.as_of_date for h in all_holdings]),
+        },
+        copy=False,
+    )
 
-        holdings_records.append(
-            {
-                "reported_holding_id": str(uuid.uuid4()),
-                "fund_report_id": fund_report_id,
-                "company_id": None,  # Will be resolved by entity resolution
-                "raw_company_name": holding.company_name,
-                "reported_sector": holding.business_description,  # Use business description as sector
-                "reported_country": None,  # BDC filings rarely include country
-                "reported_value_usd": fair_value_usd,
-                "reported_pct_nav": None,  # Can be computed later
-                "extraction_method": EXTRACTION_METHOD,
-                "extraction_confidence": EXTRACTION_CONFIDENCE,
-                "document_id": None,
-                "page_number": None,
-                "row_number": holding.row_number,
-                "as_of_date": holding.as_of_date,
-            }
-        )
+    return holdings_df, fund_df, fund_report_df
 
-    if skipped_count > 0:
-        logger.info(f"Skipped {skipped_count} holdings with unreasonable values (likely share counts)")
 
-    holdings_df = pd.DataFrame(holdings_records)
+def parse_many(
+    filenames: list[str], num_workers: int = 1, use_cache: bool = False
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Parse several BDC filings and combine their outputs.
+
+    Filings are parsed inline by default; num_workers > 1 opts in to fanning
+    them out across a process pool. Results are concatenated in the order of
+    filenames. use_cache is passed to parse_bdc_filing.
+
+    Returns:
+        Tuple of (holdings_df, fund_df, fund_report_df)
+    """
+    if num_workers <= 1 or len(filenames) <= 1:
+        results = [parse_bdc_filing(filename, use_cache) for filename in filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(filenames))) as pool:
+            results = list(pool.map(parse_bdc_filing, filenames, [use_cache] * len(filenames)))
+
+    if not results:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    holdings_dfs, fund_dfs, fund_report_dfs = zip(*results)
+    return (
+        pd.concat(holdings_dfs, ignore_index=True),
+        pd.concat(fund_dfs, ignore_index=True),
+        pd.concat(fund_report_dfs, ignore_index=True),
+    )
 
-    return holdings_df, fund_df, fund_report_df
 
+def extract_fund_name(
+    root: lxml.html.HtmlElement, filename: str, head_text: Optional[str] = None
+) -> str:
+    """Extract fund/company name from the filing.
 
-def extract_fund_name(soup: BeautifulSoup, filename: str) -> str:
-    """Extract fund/company name from the filing."""
+    head_text may be passed when the caller already has the document's leading text
+    (at least the first 5000 characters of _text(root)).
+    """
     # Try to find company name in the document
     # Look for patterns like "MAIN STREET CAPITAL CORPORATION"
-    title_patterns = [
-        r"([A-Z][A-Z\s&]+(?:CORPORATION|CORP\.|INC\.|LLC|LP|CAPITAL|PARTNERS))",
-    ]
-
-    text = soup.get_text()
+    if head_text is None:
+        head_text = _leading_text(root, 5000)
+    text = head_text[:5000]  # Check first 5000 chars
 
-    for pattern in title_patterns:
-        matches = re.findall(pattern, text[:5000])  # Check first 5000 chars
-        if matches:
-            # Return the longest match (likely the full company name)
-            return max(matches, key=len).strip()
+    matches = _FUND_NAME_RE.findall(text)
+    if matches:
+        # Return the longest match (likely the full company name)
+        return max(matches, key=len).strip()
 
     # Fallback: use filename
     name = filename.replace("_10K_", " ").replace("_", " ").replace(".html", "")
     return name.split()[0] + " Capital"
 
 
-def extract_report_date(soup: BeautifulSoup, filename: str) -> str:
-    """Extract report date from the filing."""
+def extract_report_date(
+    root: lxml.html.HtmlElement, filename: str, head_text: Optional[str] = None
+) -> str:
+    """Extract report date from the filing.
+
+    head_text may be passed when the caller already has the document's leading text
+    (at least the first 10000 characters of _text(root)).
+    """
     # Try to find date in filename first (e.g., MAIN_10K_2025.html -> 2024-12-31)
-    year_match = re.search(r"(\d{4})", filename)
+    year_match = _FILENAME_YEAR_RE.search(filename)
     if year_match:
         year = int(year_match.group(1))
         # 10-K filings are for the prior year end
         return f"{year - 1}-12-31"
 
-    # Try to find in document
-    text = soup.get_text()
-    date_patterns = [
-        r"December\s*31,\s*(\d{4})",
-        r"(\d{4})-12-31",
-        r"fiscal year ended.*?(\d{4})",
-    ]
+    # Try to find in document (first 10000 chars)
+    if head_text is None:
+        head_text = _leading_text(root, 10000)
+    text = head_text[:10000]
 
-    for pattern in date_patterns:
-        match = re.search(pattern, text[:10000], re.IGNORECASE)
+    for pattern in _REPORT_DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
             year = int(match.group(1))
             return f"{year}-12-31"
@@ -1250,63 +1494,96 @@ def print_summary(holdings_df: pd.DataFrame) -> None:
 
         # Top sectors (business descriptions)
         if "reported_sector" in holdings_df.columns:
-            sectors = holdings_df["reported_sector"].dropna()
-            if not sectors.empty:
-                sector_counts = Counter(sectors)
+            # One grouped pass for counts and values; sort=False plus a stable sort
+            # keeps ties in first-seen order, like Counter.most_common
+            sector_stats = (
+                holdings_df.groupby("reported_sector", sort=False, observed=True)["reported_value_usd"]
+                .agg(["size", "sum"])
+                .sort_values("size", ascending=False, kind="stable")
+                .head(10)
+            )
+            if not sector_stats.empty:
                 print("\nTop 10 sectors/industries:")
-                for sector, count in sector_counts.most_common(10):
-                    sector_holdings = holdings_df[holdings_df["reported_sector"] == sector]
-                    sector_value = sector_holdings["reported_value_usd"].sum()
+                for sector, count, sector_value in sector_stats.itertuples(name=None):
                     print(f"  {sector[:50]:50s} {count:4d} holdings  ${sector_value:>15,.0f}")
 
     print("\n" + "=" * 60)
 
 
+def append_silver_csv(df: pd.DataFrame, path: Path, key: str) -> int:
+    """Add rows to a silver CSV, replacing existing rows that share the same key.
+
+    New rows are appended in place when none of their keys are already in the file
+    and the columns line up, so the cost is O(new rows); only when rows must be
+    replaced is the file read in full and rewritten without the replaced rows.
+
+    Returns:
+        Total number of rows in the file after writing
+    """
+    df = df.drop_duplicates(subset=[key], keep="last")
+    if not path.exists():
+        df.to_csv(path, index=False)
+        return len(df)
+
+    # Existing rows are only ever compared or carried over as raw text, so the
+    # reads skip type inference and NA detection entirely (na_filter=False)
+    header = list(pd.read_csv(path, nrows=0).columns)
+    if header == list(df.columns):
+        existing_keys = pd.read_csv(path, usecols=[key], dtype=str, na_filter=False)[key]
+        if not df[key].astype(str).isin(existing_keys).any():
+            df.to_csv(path, mode="a", header=False, index=False)
+            return len(existing_keys) + len(df)
+
+    # Only the rows being replaced are dropped; the rest keep their original text
+    existing = pd.read_csv(path, dtype=str, na_filter=False)
+    existing = existing[~existing[key].isin(df[key].astype(str))]
+    combined = pd.concat([existing, df], ignore_index=True)
+    combined.to_csv(path, index=False)
+    return len(combined)
+
+
 def main():
-    parser = argparse.ArgumentParser(description="Parse BDC 10-K filing to extract holdings")
+    parser = argparse.ArgumentParser(description="Parse BDC 10-K filings to extract holdings")
     parser.add_argument(
         "--file",
+        "--files",
+        dest="file",
         type=str,
+        nargs="+",
         required=True,
-        help="Name of HTML filing in data/bronze/filings/ (e.g., MAIN_10K_2025.html)",
+        help="Name(s) of HTML filings in data/bronze/filings/ (e.g., MAIN_10K_2025.html)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the cached parse of an unchanged filing (data/silver/.parse_cache/)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to parse several filings (default: 1, parse inline)",
     )
     args = parser.parse_args()
 
     try:
-        holdings_df, fund_df, fund_report_df = parse_bdc_filing(args.file)
+        holdings_df, fund_df, fund_report_df = parse_many(args.file, args.workers, use_cache=args.cache)
 
-        # Write outputs to silver layer with bdc_ prefix
-        # Append to existing files if they exist, then deduplicate
+        # Write outputs to silver layer with bdc_ prefix, once for all filings
+        # Existing rows with the same id are replaced by the new ones
         SILVER_DIR.mkdir(parents=True, exist_ok=True)
 
         holdings_path = SILVER_DIR / "bdc_fact_reported_holding.csv"
         fund_path = SILVER_DIR / "bdc_dim_fund.csv"
         report_path = SILVER_DIR / "bdc_fact_fund_report.csv"
 
-        # Append holdings and deduplicate by reported_holding_id
-        if holdings_path.exists():
-            existing_holdings = pd.read_csv(holdings_path)
-            holdings_df = pd.concat([existing_holdings, holdings_df], ignore_index=True)
-            holdings_df = holdings_df.drop_duplicates(subset=["reported_holding_id"], keep="last")
-        holdings_df.to_csv(holdings_path, index=False)
-
-        # Append funds and deduplicate by fund_id
-        if fund_path.exists():
-            existing_funds = pd.read_csv(fund_path)
-            fund_df = pd.concat([existing_funds, fund_df], ignore_index=True)
-            fund_df = fund_df.drop_duplicates(subset=["fund_id"], keep="last")
-        fund_df.to_csv(fund_path, index=False)
-
-        # Append fund reports and deduplicate by fund_report_id
-        if report_path.exists():
-            existing_reports = pd.read_csv(report_path)
-            fund_report_df = pd.concat([existing_reports, fund_report_df], ignore_index=True)
-            fund_report_df = fund_report_df.drop_duplicates(subset=["fund_report_id"], keep="last")
-        fund_report_df.to_csv(report_path, index=False)
-
-        logger.info(f"Wrote {len(holdings_df)} total holdings to {holdings_path}")
-        logger.info(f"Wrote {len(fund_df)} total funds to {fund_path}")
-        logger.info(f"Wrote {len(fund_report_df)} total fund reports to {report_path}")
+        total_holdings = append_silver_csv(holdings_df, holdings_path, "reported_holding_id")
+        total_funds = append_silver_csv(fund_df, fund_path, "fund_id")
+        total_reports = append_silver_csv(fund_report_df, report_path, "fund_report_id")
+
+        logger.info(f"Wrote {total_holdings} total holdings to {holdings_path}")
+        logger.info(f"Wrote {total_funds} total funds to {fund_path}")
+        logger.info(f"Wrote {total_reports} total fund reports to {report_path}")
 
         print_summary(holdings_df)
 
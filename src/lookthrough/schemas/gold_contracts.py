@@ -5,8 +5,11 @@ and consistency across the look-through pipeline.
 """
 from __future__ import annotations
 
-from typing import Literal, Optional
+import operator
+from types import UnionType
+from typing import Any, Literal, Optional, Union, get_args, get_origin
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field, ValidationError
 
@@ -101,6 +104,9 @@ def validate_dataframe(df: pd.DataFrame, model: type[BaseModel]) -> list[str]:
     """
     Validate each row of a DataFrame against a Pydantic model.
 
+    Column-level checks run first; only rows they cannot vouch for are passed
+    through the Pydantic model one by one, so error messages are unchanged.
+
     Args:
         df: DataFrame to validate
         model: Pydantic model class to validate against
@@ -110,12 +116,14 @@ def validate_dataframe(df: pd.DataFrame, model: type[BaseModel]) -> list[str]:
     """
     errors: list[str] = []
 
-    for idx, row in df.iterrows():
-        row_dict = row.to_dict()
-        # Convert NaN values to None for Pydantic
-        for key, value in row_dict.items():
-            if pd.isna(value):
-                row_dict[key] = None
+    suspect = df.loc[~_rows_passing_column_checks(df, model)]
+    columns = tuple(suspect.columns)
+    # Null mask computed once for all cells; NaN values are converted to None for Pydantic
+    null_rows = suspect.isna().to_numpy()
+    for (idx, *values), nulls in zip(suspect.itertuples(index=True, name=None), null_rows):
+        row_dict = {
+            key: None if is_null else value for key, value, is_null in zip(columns, values, nulls)
+        }
 
         try:
             model.model_validate(row_dict)
@@ -124,3 +132,107 @@ def validate_dataframe(df: pd.DataFrame, model: type[BaseModel]) -> list[str]:
 
     print(f"Validated {len(df)} rows against {model.__name__}: {len(errors)} errors")
     return errors
+
+
+def _rows_passing_column_checks(df: pd.DataFrame, model: type[BaseModel]) -> np.ndarray:
+    """Vectorized pre-check of df against model's fields.
+
+    Returns a mask that is True only for rows certain to validate. Checks are
+    conservative: any field type, constraint or model setting not handled here
+    leaves its rows False so they fall back to per-row validation.
+    """
+    n = len(df)
+    if (
+        model.model_config.get("strict")
+        or _defines_custom_behaviour(model)
+        or (model.model_config.get("extra") == "forbid" and not set(df.columns) <= set(model.model_fields))
+    ):
+        return np.zeros(n, dtype=bool)
+
+    passing = np.ones(n, dtype=bool)
+    for name, field in model.model_fields.items():
+        if name not in df.columns:
+            if field.is_required():
+                return np.zeros(n, dtype=bool)
+            continue
+
+        column = df[name]
+        # Null cells are sent to Pydantic as None (as in the per-row path)
+        null = column.isna().to_numpy()
+        annotation, allows_none = _unwrap_optional(field.annotation)
+        if not allows_none:
+            passing &= ~null
+
+        passing &= null | _values_match_field(column, annotation, field.metadata)
+
+    return passing
+
+
+def _defines_custom_behaviour(model: type[BaseModel]) -> bool:
+    """True if model (or a parent model) defines anything in its class body besides fields.
+
+    Validators, serializers and hooks such as model_post_init all live in the
+    class namespace, so any such attribute sends the model down the per-row path.
+    """
+    return any(
+        name not in _PLAIN_MODEL_ATTRS and not (name.startswith("__") and name.endswith("__"))
+        for cls in model.__mro__
+        if cls not in BaseModel.__mro__
+        for name in vars(cls)
+    )
+
+
+# Non-dunder attributes every plain pydantic model class carries
+_PLAIN_MODEL_ATTRS = frozenset({"model_config", "_abc_impl"})
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    """Split Optional[X] / X | None into (X, True); other annotations give (annotation, False)."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = get_args(annotation)
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1 and len(non_none) < len(args):
+            return non_none[0], True
+    return annotation, False
+
+
+def _values_match_field(column: pd.Series, annotation: Any, metadata: list[Any]) -> np.ndarray:
+    """Mask of non-null values in column that satisfy the field type and constraints."""
+    fails = np.zeros(len(column), dtype=bool)
+
+    if annotation is str and not metadata:
+        if pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+            return ~fails
+        return fails
+
+    if get_origin(annotation) is Literal and not metadata:
+        choices = get_args(annotation)
+        if all(isinstance(choice, str) for choice in choices):
+            return column.isin(choices).to_numpy()
+        return fails
+
+    if annotation is float and column.dtype.kind in "if":
+        matches = ~fails
+        for constraint in metadata:
+            bounds = [
+                (compare, getattr(constraint, attr))
+                for attr, compare in _BOUND_CHECKS
+                if getattr(constraint, attr, None) is not None
+            ]
+            if not bounds:
+                return fails
+            for compare, bound in bounds:
+                matches &= compare(column, bound).to_numpy()
+        return matches
+
+    return fails
+
+
+# Bound constraints from Field(ge=..., le=..., gt=..., lt=...), matched by attribute
+# name; metadata carrying none of these is not handled and falls back to Pydantic
+_BOUND_CHECKS = (
+    ("ge", operator.ge),
+    ("le", operator.le),
+    ("gt", operator.gt),
+    ("lt", operator.lt),
+)
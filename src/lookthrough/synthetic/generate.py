@@ -17,9 +17,9 @@ import hashlib
 import os
 import uuid
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import numpy as np
 import pandas as pd
@@ -113,7 +113,15 @@ def ensure_dirs(paths: Paths) -> None:
 
 def make_uuid(seed_str: str) -> str:
     """Deterministic UUID from seed string."""
-    return str(uuid.UUID(hashlib.md5(seed_str.encode()).hexdigest()))
+    # Raw digest bytes: same UUID as parsing the hexdigest, without the hex round-trip
+    return str(uuid.UUID(bytes=hashlib.md5(seed_str.encode()).digest()))
+
+
+def make_uuids(seeds: Iterable[str]) -> list[str]:
+    """Deterministic UUIDs for many seed strings (same values as make_uuid)."""
+    md5 = hashlib.md5
+    to_uuid = uuid.UUID
+    return [str(to_uuid(bytes=md5(seed.encode()).digest())) for seed in seeds]
 
 
 # ---------------------------------------------------------------------------
@@ -220,8 +228,9 @@ def generate_funds(cfg: dict, rng: np.random.Generator) -> pd.DataFrame:
         "Vanguard", "BlackRock", "Fidelity"
     ]
 
+    vintages = rng.integers(2015, 2023, size=n_private)
     for i in range(n_private):
-        vintage = rng.integers(2015, 2023)
+        vintage = vintages[i]
         funds.append({
             "fund_id": make_uuid(f"fund_private_{i}"),
             "fund_name": f"{managers[i % len(managers)]} Private Fund {chr(65 + i)}",
@@ -243,7 +252,7 @@ def generate_funds(cfg: dict, rng: np.random.Generator) -> pd.DataFrame:
             "base_currency": "USD",
         })
 
-    return pd.DataFrame(funds)
+    return pd.DataFrame(funds).astype({"fund_type": "category", "strategy": "category"})
 
 
 # ---------------------------------------------------------------------------
@@ -262,21 +271,47 @@ def generate_companies(
     missing_country_rate = cfg["v1"]["noise"]["missing_country_text_rate"]
 
     # Get all industries and countries from taxonomy
-    industries = taxonomy_nodes[
-        taxonomy_nodes["taxonomy_type"] == "industry"
-    ]["node_name"].tolist()
+    industry_nodes = taxonomy_nodes[taxonomy_nodes["taxonomy_type"] == "industry"]
+    industries = industry_nodes["node_name"].tolist()
 
     countries = COUNTRIES
 
-    companies = []
-    aliases = []
+    # Hash lookups built once: industry name -> (industry node id, sector name),
+    # and country name -> country node id
+    node_names = dict(zip(taxonomy_nodes["taxonomy_node_id"], taxonomy_nodes["node_name"]))
+    industry_lookup = {
+        name: (node_id, node_names[parent_id])
+        for name, node_id, parent_id in zip(
+            industry_nodes["node_name"],
+            industry_nodes["taxonomy_node_id"],
+            industry_nodes["parent_node_id"],
+        )
+    }
+    country_node_id_lookup = {country: make_uuid(f"country_{country}") for country in countries}
+
+    # All random choices and noise masks are drawn for every company up front
+    prefixes = rng.choice(COMPANY_NAME_PREFIXES, size=n_companies).tolist()
+    suffixes = rng.choice(COMPANY_NAME_SUFFIXES, size=n_companies).tolist()
+    industry_picks = rng.choice(industries, size=n_companies).tolist()
+    country_picks = rng.choice(countries, size=n_companies).tolist()
+    missing_sector = rng.random(n_companies) < missing_sector_rate
+    missing_country = rng.random(n_companies) < missing_country_rate
+    has_aliases = rng.random(n_companies) < alias_rate
+
+    # Column arrays filled by position; each frame is built once at the end
+    company_ids = np.array(make_uuids(f"company_{i}" for i in range(n_companies)), dtype=object)
+    company_names = np.empty(n_companies, dtype=object)
+    primary_sectors = np.empty(n_companies, dtype=object)
+    primary_industries = np.empty(n_companies, dtype=object)
+    primary_countries = np.empty(n_companies, dtype=object)
+    industry_node_ids = np.empty(n_companies, dtype=object)
+    country_node_ids = np.empty(n_companies, dtype=object)
+    aliases: dict[str, list] = {"entity_id": [], "alias_text": []}
 
     for i in range(n_companies):
-        company_id = make_uuid(f"company_{i}")
-
         # Generate company name
-        prefix = rng.choice(COMPANY_NAME_PREFIXES)
-        suffix = rng.choice(COMPANY_NAME_SUFFIXES)
+        prefix = prefixes[i]
+        suffix = suffixes[i]
         base_name = f"{prefix} {suffix}"
 
         # Add number suffix to avoid duplicates
@@ -287,49 +322,68 @@ def generate_companies(
             base_name = f"{prefix}{i % 100:02d} {suffix}" if i > 50 else base_name
 
         # Assign industry and country
-        industry = rng.choice(industries)
-        country = rng.choice(countries)
+        industry = industry_picks[i]
+        country = country_picks[i]
 
         # Find sector for this industry
-        industry_row = taxonomy_nodes[taxonomy_nodes["node_name"] == industry].iloc[0]
-        sector_row = taxonomy_nodes[
-            taxonomy_nodes["taxonomy_node_id"] == industry_row["parent_node_id"]
-        ].iloc[0]
+        industry_node_id, sector_name = industry_lookup[industry]
 
         # Apply missing data noise
-        sector_text = None if rng.random() < missing_sector_rate else sector_row["node_name"]
-        country_text = None if rng.random() < missing_country_rate else country
-
-        companies.append({
-            "company_id": company_id,
-            "company_name": base_name,
-            "primary_sector": sector_text,
-            "primary_industry": industry if sector_text else None,
-            "primary_country": country_text,
-            "industry_taxonomy_node_id": industry_row["taxonomy_node_id"],
-            "country_taxonomy_node_id": make_uuid(f"country_{country}"),
-            "website": f"https://www.{base_name.lower().replace(' ', '')}.com",
-            "created_at": date.today().isoformat(),
-        })
-
-        # Generate aliases for some companies
-        if rng.random() < alias_rate:
-            alias_variants = _generate_alias_variants(base_name, rng)
-            for alias_text in alias_variants:
-                aliases.append({
-                    "alias_id": make_uuid(f"alias_{company_id}_{alias_text}"),
-                    "entity_type": "company",
-                    "entity_id": company_id,
-                    "alias_text": alias_text,
-                    "confidence": round(float(rng.uniform(0.7, 0.95)), 2),
-                    "source": "synthetic",
-                })
-
-    return pd.DataFrame(companies), pd.DataFrame(aliases)
-
-
-def _generate_alias_variants(company_name: str, rng: np.random.Generator) -> list[str]:
-    """Generate realistic name variants for a company."""
+        sector_text = None if missing_sector[i] else sector_name
+        country_text = None if missing_country[i] else country
+
+        company_names[i] = base_name
+        primary_sectors[i] = sector_text
+        primary_industries[i] = industry if sector_text else None
+        primary_countries[i] = country_text
+        industry_node_ids[i] = industry_node_id
+        country_node_ids[i] = country_node_id_lookup[country]
+
+    # Generate aliases for some companies; whether each gets a typo variant and
+    # where the swap lands are drawn for all of them at once
+    alias_rows = np.flatnonzero(has_aliases)
+    name_lengths = np.array([len(company_names[i]) for i in alias_rows], dtype=np.int64)
+    wants_typo = (name_lengths > 4) & (rng.random(len(alias_rows)) < 0.5)
+    typo_positions = rng.integers(1, np.maximum(name_lengths - 2, 2))
+    for i, typo, typo_idx in zip(alias_rows, wants_typo, typo_positions.tolist()):
+        company_id = company_ids[i]
+        alias_variants = _generate_alias_variants(company_names[i], typo_idx if typo else None)
+        for alias_text in alias_variants:
+            aliases["entity_id"].append(company_id)
+            aliases["alias_text"].append(alias_text)
+
+    companies_df = pd.DataFrame({
+        "company_id": company_ids,
+        "company_name": company_names,
+        # Low-cardinality text columns are categorical (small integer codes per row)
+        "primary_sector": pd.Categorical(primary_sectors),
+        "primary_industry": pd.Categorical(primary_industries),
+        "primary_country": pd.Categorical(primary_countries),
+        "industry_taxonomy_node_id": industry_node_ids,
+        "country_taxonomy_node_id": country_node_ids,
+        "website": [f"https://www.{name.lower().replace(' ', '')}.com" for name in company_names],
+        "created_at": date.today().isoformat(),
+    })
+    aliases_df = pd.DataFrame({
+        "alias_id": make_uuids(
+            f"alias_{company_id}_{alias_text}"
+            for company_id, alias_text in zip(aliases["entity_id"], aliases["alias_text"])
+        ),
+        "entity_type": "company",
+        "entity_id": aliases["entity_id"],
+        "alias_text": aliases["alias_text"],
+        "confidence": np.round(rng.uniform(0.7, 0.95, len(aliases["entity_id"])), 2),
+        "source": "synthetic",
+    })
+    return companies_df, aliases_df
+
+
+def _generate_alias_variants(company_name: str, typo_idx: int | None = None) -> list[str]:
+    """Generate realistic name variants for a company.
+
+    A typo variant swapping the letters at typo_idx and typo_idx + 1 is added
+    when typo_idx is given.
+    """
     variants = []
     parts = company_name.split()
 
@@ -343,8 +397,8 @@ def _generate_alias_variants(company_name: str, rng: np.random.Generator) -> lis
         variants.append(parts[0])
 
     # Typo variant (swap two letters)
-    if len(company_name) > 4 and rng.random() < 0.5:
-        idx = rng.integers(1, len(company_name) - 2)
+    if typo_idx is not None:
+        idx = typo_idx
         typo = company_name[:idx] + company_name[idx + 1] + company_name[idx] + company_name[idx + 2:]
         variants.append(typo)
 
@@ -365,39 +419,35 @@ def generate_fund_reports(
     coverage_min = cfg["v1"]["reporting"]["coverage_pct_min"]
     coverage_max = cfg["v1"]["reporting"]["coverage_pct_max"]
 
-    # Generate quarter end dates (most recent 8 quarters)
-    today = date.today()
-    quarter_ends = []
-    for q in range(n_quarters):
-        # Go back q quarters
-        months_back = (q + 1) * 3
-        year = today.year - (today.month - months_back - 1) // 12
-        month = ((today.month - months_back - 1) % 12) + 1
-        # Adjust to quarter end
-        quarter_month = ((month - 1) // 3 + 1) * 3
-        if quarter_month > 12:
-            quarter_month = 12
-        quarter_end = date(year, quarter_month, 1) + timedelta(days=31)
-        quarter_end = date(quarter_end.year, quarter_end.month, 1) - timedelta(days=1)
-        quarter_ends.append(quarter_end)
-
-    quarter_ends = sorted(quarter_ends)
-
-    reports = []
-    for _, fund in funds_df.iterrows():
-        for period_end in quarter_ends:
-            coverage = rng.uniform(coverage_min, coverage_max)
-            reports.append({
-                "fund_report_id": make_uuid(f"report_{fund['fund_id']}_{period_end}"),
-                "fund_id": fund["fund_id"],
-                "report_period_end": period_end.isoformat(),
-                "received_date": (period_end + timedelta(days=int(rng.integers(30, 90)))).isoformat(),
-                "document_id": None,  # No bronze document for synthetic
-                "coverage_estimate": round(float(coverage), 2),
-                "nav_usd": int(rng.integers(50_000_000, 500_000_000)),
-            })
+    # Quarter end dates of the most recent completed quarters, oldest first
+    last_quarter = pd.Period(date.today(), freq="Q") - 1
+    quarter_ends = (
+        pd.period_range(end=last_quarter, periods=n_quarters, freq="Q")
+        .end_time.to_numpy()
+        .astype("datetime64[D]")
+    )
 
-    return pd.DataFrame(reports)
+    # One report per fund and quarter (fund-major), with every draw made in bulk
+    n_funds = len(funds_df)
+    n_reports = n_funds * n_quarters
+    fund_ids = np.repeat(funds_df["fund_id"].to_numpy(dtype=object), n_quarters)
+    period_ends = np.tile(quarter_ends, n_funds)
+    coverage = rng.uniform(coverage_min, coverage_max, n_reports)
+    received_lag = rng.integers(30, 90, n_reports).astype("timedelta64[D]")
+    nav = rng.integers(50_000_000, 500_000_000, n_reports)
+
+    period_end_text = np.datetime_as_string(period_ends).tolist()
+    return pd.DataFrame({
+        "fund_report_id": make_uuids(
+            f"report_{fund_id}_{period_end}" for fund_id, period_end in zip(fund_ids, period_end_text)
+        ),
+        "fund_id": fund_ids,
+        "report_period_end": period_end_text,
+        "received_date": np.datetime_as_string(period_ends + received_lag).tolist(),
+        "document_id": None,  # No bronze document for synthetic
+        "coverage_estimate": np.round(coverage, 2),
+        "nav_usd": nav,
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -416,76 +466,101 @@ def generate_holdings(
     pct_nav_populated_rate = cfg["v1"]["reporting"]["pct_nav_populated_rate"]
     conflicting_sector_rate = cfg["v1"]["noise"]["conflicting_sector_rate"]
 
-    holdings = []
-    company_list = companies_df.to_dict("records")
-    n_companies = len(company_list)
-
-    for _, report in fund_reports_df.iterrows():
-        fund = funds_df[funds_df["fund_id"] == report["fund_id"]].iloc[0]
-        nav = report["nav_usd"]
-        coverage = report["coverage_estimate"]
-
+    n_companies = len(companies_df)
+    fund_types = dict(zip(funds_df["fund_id"], funds_df["fund_type"]))
+    # Per-fund seed for the core holdings, hashed once per fund rather than per report
+    fund_seeds = {
+        fund_id: int.from_bytes(hashlib.md5(fund_id.encode()).digest()[:4], "big")
+        for fund_id in funds_df["fund_id"]
+    }
+
+    # Per report: pick the companies. Everything drawn per holding is
+    # generated afterwards in bulk over the flattened holdings
+    report_company_indices = []
+    for fund_id in fund_reports_df["fund_id"]:
         # Determine number of holdings for this fund
-        if fund["fund_type"] == "private":
+        if fund_types[fund_id] == "private":
             n_holdings = rng.integers(15, 40)
         else:
             n_holdings = rng.integers(30, 80)
 
         # Select companies for this fund (with some overlap across quarters)
-        fund_seed = int(hashlib.md5(fund["fund_id"].encode()).hexdigest()[:8], 16)
-        rng_fund = np.random.default_rng(fund_seed)
+        rng_fund = np.random.default_rng(fund_seeds[fund_id])
 
         # Core holdings (consistent across quarters) + some variation
         n_core = int(n_holdings * 0.7)
         core_indices = rng_fund.choice(n_companies, size=min(n_core, n_companies), replace=False)
         variable_indices = rng.choice(n_companies, size=min(n_holdings - n_core, n_companies), replace=False)
-        selected_indices = list(set(core_indices) | set(variable_indices))[:n_holdings]
-
-        # Generate weights (power law distribution for realistic concentration)
-        raw_weights = rng.pareto(1.5, len(selected_indices))
-        weights = raw_weights / raw_weights.sum() * coverage
-
-        for idx, (company_idx, weight) in enumerate(zip(selected_indices, weights)):
-            company = company_list[company_idx]
-            holding_value = nav * weight
-
-            # Apply noise
-            reported_value = holding_value if rng.random() < value_populated_rate else None
-            reported_pct = weight * 100 if rng.random() < pct_nav_populated_rate else None
-
-            # Raw company name (might be alias or have typos)
-            raw_name = company["company_name"]
-            if rng.random() < 0.1:
-                # Use abbreviation or variant
-                parts = raw_name.split()
-                if len(parts) >= 2:
-                    raw_name = "".join(p[0] for p in parts) if rng.random() < 0.5 else parts[0]
-
-            # Reported sector (might conflict)
-            reported_sector = company["primary_sector"]
-            if rng.random() < conflicting_sector_rate and reported_sector:
-                # Assign wrong sector
-                all_sectors = list(SECTORS_AND_INDUSTRIES.keys())
-                wrong_sectors = [s for s in all_sectors if s != reported_sector]
-                reported_sector = rng.choice(wrong_sectors)
-
-            holdings.append({
-                "reported_holding_id": make_uuid(f"holding_{report['fund_report_id']}_{idx}"),
-                "fund_report_id": report["fund_report_id"],
-                "company_id": company["company_id"] if rng.random() > 0.05 else None,  # 5% unresolved
-                "raw_company_name": raw_name,
-                "reported_sector": reported_sector,
-                "reported_country": company["primary_country"],
-                "reported_value_usd": round(reported_value, 2) if reported_value else None,
-                "reported_pct_nav": round(reported_pct, 2) if reported_pct else None,
-                "extraction_method": "synthetic",
-                "extraction_confidence": round(float(rng.uniform(0.85, 0.99)), 2),
-                "document_id": None,
-                "page_number": None,
-                "row_number": idx + 1,
-            })
-
-    return pd.DataFrame(holdings)
+        # Union in first-seen order (core holdings first), without Python sets
+        combined = np.concatenate([core_indices, variable_indices])
+        _, first_seen = np.unique(combined, return_index=True)
+        report_company_indices.append(combined[np.sort(first_seen)][:n_holdings])
+
+    if not report_company_indices:
+        return pd.DataFrame()
+
+    # Flatten to one entry per holding
+    holdings_per_report = np.array([len(idx) for idx in report_company_indices])
+    n_reports = len(holdings_per_report)
+    report_pos = np.repeat(np.arange(n_reports), holdings_per_report)  # report of each holding
+    company_idx = np.concatenate(report_company_indices)
+    report_ids = fund_reports_df["fund_report_id"].to_numpy()[report_pos]
+    report_starts = np.cumsum(holdings_per_report) - holdings_per_report
+    row_idx = np.arange(len(company_idx)) - report_starts[report_pos]
+    n = len(company_idx)
+
+    # Generate weights (power law distribution for realistic concentration),
+    # normalized per report so each report's weights sum to its coverage
+    raw_weights = rng.pareto(1.5, n)
+    report_totals = np.bincount(report_pos, weights=raw_weights, minlength=n_reports)
+    coverage = fund_reports_df["coverage_estimate"].to_numpy(dtype=np.float64)
+    weights = raw_weights * (coverage / report_totals)[report_pos]
+    holding_value = fund_reports_df["nav_usd"].to_numpy(dtype=np.float64)[report_pos] * weights
+
+    # Apply noise
+    reported_value = np.where(rng.random(n) < value_populated_rate, np.round(holding_value, 2), np.nan)
+    reported_pct = np.where(rng.random(n) < pct_nav_populated_rate, np.round(weights * 100, 2), np.nan)
+
+    # Raw company name (might be alias or have typos)
+    raw_names = companies_df["company_name"].to_numpy(dtype=object)[company_idx]
+    variant_rows = np.flatnonzero(rng.random(n) < 0.1)
+    use_abbrev = rng.random(len(variant_rows)) < 0.5
+    for row, abbrev in zip(variant_rows, use_abbrev):
+        # Use abbreviation or variant
+        parts = raw_names[row].split()
+        if len(parts) >= 2:
+            raw_names[row] = "".join(p[0] for p in parts) if abbrev else parts[0]
+
+    # Reported sector (might conflict): a wrong sector is drawn from the other
+    # K - 1 sectors by skipping over the company's own sector code
+    all_sectors = np.array(list(SECTORS_AND_INDUSTRIES), dtype=object)
+    sector_codes = pd.Categorical(
+        companies_df["primary_sector"], categories=all_sectors
+    ).codes[company_idx]
+    conflicting = np.flatnonzero((rng.random(n) < conflicting_sector_rate) & (sector_codes >= 0))
+    wrong_codes = rng.integers(0, len(all_sectors) - 1, len(conflicting))
+    wrong_codes += wrong_codes >= sector_codes[conflicting]
+    reported_sector = companies_df["primary_sector"].to_numpy(dtype=object)[company_idx]
+    reported_sector[conflicting] = all_sectors[wrong_codes]
+
+    company_ids = companies_df["company_id"].to_numpy(dtype=object)[company_idx]
+    resolved = rng.random(n) > 0.05  # 5% unresolved
+
+    return pd.DataFrame({
+        "reported_holding_id": make_uuids(f"holding_{r}_{i}" for r, i in zip(report_ids, row_idx.tolist())),
+        "fund_report_id": report_ids,
+        "company_id": np.where(resolved, company_ids, None),
+        "raw_company_name": raw_names,
+        "reported_sector": pd.Categorical(reported_sector, categories=all_sectors),
+        "reported_country": pd.Categorical(companies_df["primary_country"])[company_idx],
+        "reported_value_usd": reported_value,
+        "reported_pct_nav": reported_pct,
+        "extraction_method": pd.Categorical(["synthetic"] * n),
+        "extraction_confidence": np.round(rng.uniform(0.85, 0.99, n), 2),
+        "document_id": None,
+        "page_number": None,
+        "row_number": row_idx + 1,
+    })
 
 
 # ---------------------------------------------------------------------------
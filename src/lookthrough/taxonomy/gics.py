@@ -12,11 +12,15 @@ Source: MSCI/S&P GICS structure (2023 revision)
 
 from __future__ import annotations
 
+import hashlib
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, Iterable, Mapping, Optional
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def _repo_root() -> Path:
@@ -24,10 +28,28 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
+_UUID_NAMESPACE: Final = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # UUID namespace
+
+# Fixed taxonomy version ID for GICS
+_TAXONOMY_VERSION_ID: Final[str] = str(uuid.uuid5(_UUID_NAMESPACE, "gics_2023"))
+
+
 def _deterministic_uuid(gics_code: str) -> str:
     """Generate deterministic UUID from GICS code using namespace UUID."""
-    namespace = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # UUID namespace
-    return str(uuid.uuid5(namespace, f"gics_{gics_code}"))
+    return str(uuid.uuid5(_UUID_NAMESPACE, f"gics_{gics_code}"))
+
+
+def _deterministic_uuids(gics_codes: Iterable[str]) -> list[str]:
+    """Generate deterministic UUIDs for many GICS codes (same values as _deterministic_uuid)."""
+    # uuid5 is SHA-1 over namespace bytes + name: hash the shared "gics_" prefix
+    # once and extend a copy of that state per code
+    prefix = hashlib.sha1(_UUID_NAMESPACE.bytes + b"gics_", usedforsecurity=False)
+    ids = []
+    for code in gics_codes:
+        digest = prefix.copy()
+        digest.update(code.encode())
+        ids.append(str(uuid.UUID(bytes=digest.digest()[:16], version=5)))
+    return ids
 
 
 # =============================================================================
@@ -51,467 +73,521 @@ GICS_SECTORS = [
 
 GICS_INDUSTRY_GROUPS = [
     # Energy
-    {"code": "1010", "name": "Energy", "parent_code": "10"},
+    {"code": "1010", "name": "Energy"},
     # Materials
-    {"code": "1510", "name": "Materials", "parent_code": "15"},
+    {"code": "1510", "name": "Materials"},
     # Industrials
-    {"code": "2010", "name": "Capital Goods", "parent_code": "20"},
-    {"code": "2020", "name": "Commercial & Professional Services", "parent_code": "20"},
-    {"code": "2030", "name": "Transportation", "parent_code": "20"},
+    {"code": "2010", "name": "Capital Goods"},
+    {"code": "2020", "name": "Commercial & Professional Services"},
+    {"code": "2030", "name": "Transportation"},
     # Consumer Discretionary
-    {"code": "2510", "name": "Automobiles & Components", "parent_code": "25"},
-    {"code": "2520", "name": "Consumer Durables & Apparel", "parent_code": "25"},
-    {"code": "2530", "name": "Consumer Services", "parent_code": "25"},
-    {"code": "2550", "name": "Consumer Discretionary Distribution & Retail", "parent_code": "25"},
+    {"code": "2510", "name": "Automobiles & Components"},
+    {"code": "2520", "name": "Consumer Durables & Apparel"},
+    {"code": "2530", "name": "Consumer Services"},
+    {"code": "2550", "name": "Consumer Discretionary Distribution & Retail"},
     # Consumer Staples
-    {"code": "3010", "name": "Consumer Staples Distribution & Retail", "parent_code": "30"},
-    {"code": "3020", "name": "Food, Beverage & Tobacco", "parent_code": "30"},
-    {"code": "3030", "name": "Household & Personal Products", "parent_code": "30"},
+    {"code": "3010", "name": "Consumer Staples Distribution & Retail"},
+    {"code": "3020", "name": "Food, Beverage & Tobacco"},
+    {"code": "3030", "name": "Household & Personal Products"},
     # Health Care
-    {"code": "3510", "name": "Health Care Equipment & Services", "parent_code": "35"},
-    {"code": "3520", "name": "Pharmaceuticals, Biotechnology & Life Sciences", "parent_code": "35"},
+    {"code": "3510", "name": "Health Care Equipment & Services"},
+    {"code": "3520", "name": "Pharmaceuticals, Biotechnology & Life Sciences"},
     # Financials
-    {"code": "4010", "name": "Banks", "parent_code": "40"},
-    {"code": "4020", "name": "Financial Services", "parent_code": "40"},
-    {"code": "4030", "name": "Insurance", "parent_code": "40"},
+    {"code": "4010", "name": "Banks"},
+    {"code": "4020", "name": "Financial Services"},
+    {"code": "4030", "name": "Insurance"},
     # Information Technology
-    {"code": "4510", "name": "Software & Services", "parent_code": "45"},
-    {"code": "4520", "name": "Technology Hardware & Equipment", "parent_code": "45"},
-    {"code": "4530", "name": "Semiconductors & Semiconductor Equipment", "parent_code": "45"},
+    {"code": "4510", "name": "Software & Services"},
+    {"code": "4520", "name": "Technology Hardware & Equipment"},
+    {"code": "4530", "name": "Semiconductors & Semiconductor Equipment"},
     # Communication Services
-    {"code": "5010", "name": "Telecommunication Services", "parent_code": "50"},
-    {"code": "5020", "name": "Media & Entertainment", "parent_code": "50"},
+    {"code": "5010", "name": "Telecommunication Services"},
+    {"code": "5020", "name": "Media & Entertainment"},
     # Utilities
-    {"code": "5510", "name": "Utilities", "parent_code": "55"},
+    {"code": "5510", "name": "Utilities"},
     # Real Estate
-    {"code": "6010", "name": "Equity Real Estate Investment Trusts (REITs)", "parent_code": "60"},
-    {"code": "6020", "name": "Real Estate Management & Development", "parent_code": "60"},
+    {"code": "6010", "name": "Equity Real Estate Investment Trusts (REITs)"},
+    {"code": "6020", "name": "Real Estate Management & Development"},
 ]
 
 GICS_INDUSTRIES = [
     # Energy (1010)
-    {"code": "101010", "name": "Energy Equipment & Services", "parent_code": "1010"},
-    {"code": "101020", "name": "Oil, Gas & Consumable Fuels", "parent_code": "1010"},
+    {"code": "101010", "name": "Energy Equipment & Services"},
+    {"code": "101020", "name": "Oil, Gas & Consumable Fuels"},
     # Materials (1510)
-    {"code": "151010", "name": "Chemicals", "parent_code": "1510"},
-    {"code": "151020", "name": "Construction Materials", "parent_code": "1510"},
-    {"code": "151030", "name": "Containers & Packaging", "parent_code": "1510"},
-    {"code": "151040", "name": "Metals & Mining", "parent_code": "1510"},
-    {"code": "151050", "name": "Paper & Forest Products", "parent_code": "1510"},
+    {"code": "151010", "name": "Chemicals"},
+    {"code": "151020", "name": "Construction Materials"},
+    {"code": "151030", "name": "Containers & Packaging"},
+    {"code": "151040", "name": "Metals & Mining"},
+    {"code": "151050", "name": "Paper & Forest Products"},
     # Capital Goods (2010)
-    {"code": "201010", "name": "Aerospace & Defense", "parent_code": "2010"},
-    {"code": "201020", "name": "Building Products", "parent_code": "2010"},
-    {"code": "201030", "name": "Construction & Engineering", "parent_code": "2010"},
-    {"code": "201040", "name": "Electrical Equipment", "parent_code": "2010"},
-    {"code": "201050", "name": "Industrial Conglomerates", "parent_code": "2010"},
-    {"code": "201060", "name": "Machinery", "parent_code": "2010"},
-    {"code": "201070", "name": "Trading Companies & Distributors", "parent_code": "2010"},
+    {"code": "201010", "name": "Aerospace & Defense"},
+    {"code": "201020", "name": "Building Products"},
+    {"code": "201030", "name": "Construction & Engineering"},
+    {"code": "201040", "name": "Electrical Equipment"},
+    {"code": "201050", "name": "Industrial Conglomerates"},
+    {"code": "201060", "name": "Machinery"},
+    {"code": "201070", "name": "Trading Companies & Distributors"},
     # Commercial & Professional Services (2020)
-    {"code": "202010", "name": "Commercial Services & Supplies", "parent_code": "2020"},
-    {"code": "202020", "name": "Professional Services", "parent_code": "2020"},
+    {"code": "202010", "name": "Commercial Services & Supplies"},
+    {"code": "202020", "name": "Professional Services"},
     # Transportation (2030)
-    {"code": "203010", "name": "Air Freight & Logistics", "parent_code": "2030"},
-    {"code": "203020", "name": "Passenger Airlines", "parent_code": "2030"},
-    {"code": "203030", "name": "Marine Transportation", "parent_code": "2030"},
-    {"code": "203040", "name": "Ground Transportation", "parent_code": "2030"},
-    {"code": "203050", "name": "Transportation Infrastructure", "parent_code": "2030"},
+    {"code": "203010", "name": "Air Freight & Logistics"},
+    {"code": "203020", "name": "Passenger Airlines"},
+    {"code": "203030", "name": "Marine Transportation"},
+    {"code": "203040", "name": "Ground Transportation"},
+    {"code": "203050", "name": "Transportation Infrastructure"},
     # Automobiles & Components (2510)
-    {"code": "251010", "name": "Automobile Components", "parent_code": "2510"},
-    {"code": "251020", "name": "Automobiles", "parent_code": "2510"},
+    {"code": "251010", "name": "Automobile Components"},
+    {"code": "251020", "name": "Automobiles"},
     # Consumer Durables & Apparel (2520)
-    {"code": "252010", "name": "Household Durables", "parent_code": "2520"},
-    {"code": "252020", "name": "Leisure Products", "parent_code": "2520"},
-    {"code": "252030", "name": "Textiles, Apparel & Luxury Goods", "parent_code": "2520"},
+    {"code": "252010", "name": "Household Durables"},
+    {"code": "252020", "name": "Leisure Products"},
+    {"code": "252030", "name": "Textiles, Apparel & Luxury Goods"},
     # Consumer Services (2530)
-    {"code": "253010", "name": "Hotels, Restaurants & Leisure", "parent_code": "2530"},
-    {"code": "253020", "name": "Diversified Consumer Services", "parent_code": "2530"},
+    {"code": "253010", "name": "Hotels, Restaurants & Leisure"},
+    {"code": "253020", "name": "Diversified Consumer Services"},
     # Consumer Discretionary Distribution & Retail (2550)
-    {"code": "255010", "name": "Distributors", "parent_code": "2550"},
-    {"code": "255020", "name": "Broadline Retail", "parent_code": "2550"},
-    {"code": "255030", "name": "Specialty Retail", "parent_code": "2550"},
+    {"code": "255010", "name": "Distributors"},
+    {"code": "255020", "name": "Broadline Retail"},
+    {"code": "255030", "name": "Specialty Retail"},
     # Consumer Staples Distribution & Retail (3010)
-    {"code": "301010", "name": "Consumer Staples Distribution & Retail", "parent_code": "3010"},
+    {"code": "301010", "name": "Consumer Staples Distribution & Retail"},
     # Food, Beverage & Tobacco (3020)
-    {"code": "302010", "name": "Beverages", "parent_code": "3020"},
-    {"code": "302020", "name": "Food Products", "parent_code": "3020"},
-    {"code": "302030", "name": "Tobacco", "parent_code": "3020"},
+    {"code": "302010", "name": "Beverages"},
+    {"code": "302020", "name": "Food Products"},
+    {"code": "302030", "name": "Tobacco"},
     # Household & Personal Products (3030)
-    {"code": "303010", "name": "Household Products", "parent_code": "3030"},
-    {"code": "303020", "name": "Personal Care Products", "parent_code": "3030"},
+    {"code": "303010", "name": "Household Products"},
+    {"code": "303020", "name": "Personal Care Products"},
     # Health Care Equipment & Services (3510)
-    {"code": "351010", "name": "Health Care Equipment & Supplies", "parent_code": "3510"},
-    {"code": "351020", "name": "Health Care Providers & Services", "parent_code": "3510"},
-    {"code": "351030", "name": "Health Care Technology", "parent_code": "3510"},
+    {"code": "351010", "name": "Health Care Equipment & Supplies"},
+    {"code": "351020", "name": "Health Care Providers & Services"},
+    {"code": "351030", "name": "Health Care Technology"},
     # Pharmaceuticals, Biotechnology & Life Sciences (3520)
-    {"code": "352010", "name": "Biotechnology", "parent_code": "3520"},
-    {"code": "352020", "name": "Pharmaceuticals", "parent_code": "3520"},
-    {"code": "352030", "name": "Life Sciences Tools & Services", "parent_code": "3520"},
+    {"code": "352010", "name": "Biotechnology"},
+    {"code": "352020", "name": "Pharmaceuticals"},
+    {"code": "352030", "name": "Life Sciences Tools & Services"},
     # Banks (4010)
-    {"code": "401010", "name": "Banks", "parent_code": "4010"},
+    {"code": "401010", "name": "Banks"},
     # Financial Services (4020)
-    {"code": "402010", "name": "Financial Services", "parent_code": "4020"},
-    {"code": "402020", "name": "Consumer Finance", "parent_code": "4020"},
-    {"code": "402030", "name": "Capital Markets", "parent_code": "4020"},
-    {"code": "402040", "name": "Mortgage Real Estate Investment Trusts (REITs)", "parent_code": "4020"},
+    {"code": "402010", "name": "Financial Services"},
+    {"code": "402020", "name": "Consumer Finance"},
+    {"code": "402030", "name": "Capital Markets"},
+    {"code": "402040", "name": "Mortgage Real Estate Investment Trusts (REITs)"},
     # Insurance (4030)
-    {"code": "403010", "name": "Insurance", "parent_code": "4030"},
+    {"code": "403010", "name": "Insurance"},
     # Software & Services (4510)
-    {"code": "451010", "name": "IT Services", "parent_code": "4510"},
-    {"code": "451020", "name": "Software", "parent_code": "4510"},
+    {"code": "451010", "name": "IT Services"},
+    {"code": "451020", "name": "Software"},
     # Technology Hardware & Equipment (4520)
-    {"code": "452010", "name": "Communications Equipment", "parent_code": "4520"},
-    {"code": "452020", "name": "Technology Hardware, Storage & Peripherals", "parent_code": "4520"},
-    {"code": "452030", "name": "Electronic Equipment, Instruments & Components", "parent_code": "4520"},
+    {"code": "452010", "name": "Communications Equipment"},
+    {"code": "452020", "name": "Technology Hardware, Storage & Peripherals"},
+    {"code": "452030", "name": "Electronic Equipment, Instruments & Components"},
     # Semiconductors & Semiconductor Equipment (4530)
-    {"code": "453010", "name": "Semiconductors & Semiconductor Equipment", "parent_code": "4530"},
+    {"code": "453010", "name": "Semiconductors & Semiconductor Equipment"},
     # Telecommunication Services (5010)
-    {"code": "501010", "name": "Diversified Telecommunication Services", "parent_code": "5010"},
-    {"code": "501020", "name": "Wireless Telecommunication Services", "parent_code": "5010"},
+    {"code": "501010", "name": "Diversified Telecommunication Services"},
+    {"code": "501020", "name": "Wireless Telecommunication Services"},
     # Media & Entertainment (5020)
-    {"code": "502010", "name": "Media", "parent_code": "5020"},
-    {"code": "502020", "name": "Entertainment", "parent_code": "5020"},
-    {"code": "502030", "name": "Interactive Media & Services", "parent_code": "5020"},
+    {"code": "502010", "name": "Media"},
+    {"code": "502020", "name": "Entertainment"},
+    {"code": "502030", "name": "Interactive Media & Services"},
     # Utilities (5510)
-    {"code": "551010", "name": "Electric Utilities", "parent_code": "5510"},
-    {"code": "551020", "name": "Gas Utilities", "parent_code": "5510"},
-    {"code": "551030", "name": "Multi-Utilities", "parent_code": "5510"},
-    {"code": "551040", "name": "Water Utilities", "parent_code": "5510"},
-    {"code": "551050", "name": "Independent Power and Renewable Electricity Producers", "parent_code": "5510"},
+    {"code": "551010", "name": "Electric Utilities"},
+    {"code": "551020", "name": "Gas Utilities"},
+    {"code": "551030", "name": "Multi-Utilities"},
+    {"code": "551040", "name": "Water Utilities"},
+    {"code": "551050", "name": "Independent Power and Renewable Electricity Producers"},
     # Equity Real Estate Investment Trusts (REITs) (6010)
-    {"code": "601010", "name": "Diversified REITs", "parent_code": "6010"},
-    {"code": "601020", "name": "Industrial REITs", "parent_code": "6010"},
-    {"code": "601025", "name": "Hotel & Resort REITs", "parent_code": "6010"},
-    {"code": "601030", "name": "Office REITs", "parent_code": "6010"},
-    {"code": "601040", "name": "Health Care REITs", "parent_code": "6010"},
-    {"code": "601050", "name": "Residential REITs", "parent_code": "6010"},
-    {"code": "601060", "name": "Retail REITs", "parent_code": "6010"},
-    {"code": "601070", "name": "Specialized REITs", "parent_code": "6010"},
+    {"code": "601010", "name": "Diversified REITs"},
+    {"code": "601020", "name": "Industrial REITs"},
+    {"code": "601025", "name": "Hotel & Resort REITs"},
+    {"code": "601030", "name": "Office REITs"},
+    {"code": "601040", "name": "Health Care REITs"},
+    {"code": "601050", "name": "Residential REITs"},
+    {"code": "601060", "name": "Retail REITs"},
+    {"code": "601070", "name": "Specialized REITs"},
     # Real Estate Management & Development (6020)
-    {"code": "602010", "name": "Real Estate Management & Development", "parent_code": "6020"},
+    {"code": "602010", "name": "Real Estate Management & Development"},
 ]
 
 GICS_SUB_INDUSTRIES = [
     # Energy Equipment & Services (101010)
-    {"code": "10101010", "name": "Oil & Gas Drilling", "parent_code": "101010"},
-    {"code": "10101020", "name": "Oil & Gas Equipment & Services", "parent_code": "101010"},
+    {"code": "10101010", "name": "Oil & Gas Drilling"},
+    {"code": "10101020", "name": "Oil & Gas Equipment & Services"},
     # Oil, Gas & Consumable Fuels (101020)
-    {"code": "10102010", "name": "Integrated Oil & Gas", "parent_code": "101020"},
-    {"code": "10102020", "name": "Oil & Gas Exploration & Production", "parent_code": "101020"},
-    {"code": "10102030", "name": "Oil & Gas Refining & Marketing", "parent_code": "101020"},
-    {"code": "10102040", "name": "Oil & Gas Storage & Transportation", "parent_code": "101020"},
-    {"code": "10102050", "name": "Coal & Consumable Fuels", "parent_code": "101020"},
+    {"code": "10102010", "name": "Integrated Oil & Gas"},
+    {"code": "10102020", "name": "Oil & Gas Exploration & Production"},
+    {"code": "10102030", "name": "Oil & Gas Refining & Marketing"},
+    {"code": "10102040", "name": "Oil & Gas Storage & Transportation"},
+    {"code": "10102050", "name": "Coal & Consumable Fuels"},
     # Chemicals (151010)
-    {"code": "15101010", "name": "Commodity Chemicals", "parent_code": "151010"},
-    {"code": "15101020", "name": "Diversified Chemicals", "parent_code": "151010"},
-    {"code": "15101030", "name": "Fertilizers & Agricultural Chemicals", "parent_code": "151010"},
-    {"code": "15101040", "name": "Industrial Gases", "parent_code": "151010"},
-    {"code": "15101050", "name": "Specialty Chemicals", "parent_code": "151010"},
+    {"code": "15101010", "name": "Commodity Chemicals"},
+    {"code": "15101020", "name": "Diversified Chemicals"},
+    {"code": "15101030", "name": "Fertilizers & Agricultural Chemicals"},
+    {"code": "15101040", "name": "Industrial Gases"},
+    {"code": "15101050", "name": "Specialty Chemicals"},
     # Construction Materials (151020)
-    {"code": "15102010", "name": "Construction Materials", "parent_code": "151020"},
+    {"code": "15102010", "name": "Construction Materials"},
     # Containers & Packaging (151030)
-    {"code": "15103010", "name": "Metal, Glass & Plastic Containers", "parent_code": "151030"},
-    {"code": "15103020", "name": "Paper & Plastic Packaging Products & Materials", "parent_code": "151030"},
+    {"code": "15103010", "name": "Metal, Glass & Plastic Containers"},
+    {"code": "15103020", "name": "Paper & Plastic Packaging Products & Materials"},
     # Metals & Mining (151040)
-    {"code": "15104010", "name": "Aluminum", "parent_code": "151040"},
-    {"code": "15104020", "name": "Diversified Metals & Mining", "parent_code": "151040"},
-    {"code": "15104025", "name": "Copper", "parent_code": "151040"},
-    {"code": "15104030", "name": "Gold", "parent_code": "151040"},
-    {"code": "15104040", "name": "Precious Metals & Minerals", "parent_code": "151040"},
-    {"code": "15104045", "name": "Silver", "parent_code": "151040"},
-    {"code": "15104050", "name": "Steel", "parent_code": "151040"},
+    {"code": "15104010", "name": "Aluminum"},
+    {"code": "15104020", "name": "Diversified Metals & Mining"},
+    {"code": "15104025", "name": "Copper"},
+    {"code": "15104030", "name": "Gold"},
+    {"code": "15104040", "name": "Precious Metals & Minerals"},
+    {"code": "15104045", "name": "Silver"},
+    {"code": "15104050", "name": "Steel"},
     # Paper & Forest Products (151050)
-    {"code": "15105010", "name": "Forest Products", "parent_code": "151050"},
-    {"code": "15105020", "name": "Paper Products", "parent_code": "151050"},
+    {"code": "15105010", "name": "Forest Products"},
+    {"code": "15105020", "name": "Paper Products"},
     # Aerospace & Defense (201010)
-    {"code": "20101010", "name": "Aerospace & Defense", "parent_code": "201010"},
+    {"code": "20101010", "name": "Aerospace & Defense"},
     # Building Products (201020)
-    {"code": "20102010", "name": "Building Products", "parent_code": "201020"},
+    {"code": "20102010", "name": "Building Products"},
     # Construction & Engineering (201030)
-    {"code": "20103010", "name": "Construction & Engineering", "parent_code": "201030"},
+    {"code": "20103010", "name": "Construction & Engineering"},
     # Electrical Equipment (201040)
-    {"code": "20104010", "name": "Electrical Components & Equipment", "parent_code": "201040"},
-    {"code": "20104020", "name": "Heavy Electrical Equipment", "parent_code": "201040"},
+    {"code": "20104010", "name": "Electrical Components & Equipment"},
+    {"code": "20104020", "name": "Heavy Electrical Equipment"},
     # Industrial Conglomerates (201050)
-    {"code": "20105010", "name": "Industrial Conglomerates", "parent_code": "201050"},
+    {"code": "20105010", "name": "Industrial Conglomerates"},
     # Machinery (201060)
-    {"code": "20106010", "name": "Construction Machinery & Heavy Transportation Equipment", "parent_code": "201060"},
-    {"code": "20106015", "name": "Agricultural & Farm Machinery", "parent_code": "201060"},
-    {"code": "20106020", "name": "Industrial Machinery & Supplies & Components", "parent_code": "201060"},
+    {"code": "20106010", "name": "Construction Machinery & Heavy Transportation Equipment"},
+    {"code": "20106015", "name": "Agricultural & Farm Machinery"},
+    {"code": "20106020", "name": "Industrial Machinery & Supplies & Components"},
     # Trading Companies & Distributors (201070)
-    {"code": "20107010", "name": "Trading Companies & Distributors", "parent_code": "201070"},
+    {"code": "20107010", "name": "Trading Companies & Distributors"},
     # Commercial Services & Supplies (202010)
-    {"code": "20201010", "name": "Commercial Printing", "parent_code": "202010"},
-    {"code": "20201050", "name": "Environmental & Facilities Services", "parent_code": "202010"},
-    {"code": "20201060", "name": "Office Services & Supplies", "parent_code": "202010"},
-    {"code": "20201070", "name": "Diversified Support Services", "parent_code": "202010"},
-    {"code": "20201080", "name": "Security & Alarm Services", "parent_code": "202010"},
+    {"code": "20201010", "name": "Commercial Printing"},
+    {"code": "20201050", "name": "Environmental & Facilities Services"},
+    {"code": "20201060", "name": "Office Services & Supplies"},
+    {"code": "20201070", "name": "Diversified Support Services"},
+    {"code": "20201080", "name": "Security & Alarm Services"},
     # Professional Services (202020)
-    {"code": "20202010", "name": "Human Resource & Employment Services", "parent_code": "202020"},
-    {"code": "20202020", "name": "Research & Consulting Services", "parent_code": "202020"},
-    {"code": "20202030", "name": "Data Processing & Outsourced Services", "parent_code": "202020"},
+    {"code": "20202010", "name": "Human Resource & Employment Services"},
+    {"code": "20202020", "name": "Research & Consulting Services"},
+    {"code": "20202030", "name": "Data Processing & Outsourced Services"},
     # Air Freight & Logistics (203010)
-    {"code": "20301010", "name": "Air Freight & Logistics", "parent_code": "203010"},
+    {"code": "20301010", "name": "Air Freight & Logistics"},
     # Passenger Airlines (203020)
-    {"code": "20302010", "name": "Passenger Airlines", "parent_code": "203020"},
+    {"code": "20302010", "name": "Passenger Airlines"},
     # Marine Transportation (203030)
-    {"code": "20303010", "name": "Marine Transportation", "parent_code": "203030"},
+    {"code": "20303010", "name": "Marine Transportation"},
     # Ground Transportation (203040)
-    {"code": "20304010", "name": "Rail Transportation", "parent_code": "203040"},
-    {"code": "20304020", "name": "Trucking", "parent_code": "203040"},
-    {"code": "20304030", "name": "Cargo Ground Transportation", "parent_code": "203040"},
+    {"code": "20304010", "name": "Rail Transportation"},
+    {"code": "20304020", "name": "Trucking"},
+    {"code": "20304030", "name": "Cargo Ground Transportation"},
     # Transportation Infrastructure (203050)
-    {"code": "20305010", "name": "Airport Services", "parent_code": "203050"},
-    {"code": "20305020", "name": "Highways & Railtracks", "parent_code": "203050"},
-    {"code": "20305030", "name": "Marine Ports & Services", "parent_code": "203050"},
+    {"code": "20305010", "name": "Airport Services"},
+    {"code": "20305020", "name": "Highways & Railtracks"},
+    {"code": "20305030", "name": "Marine Ports & Services"},
     # Automobile Components (251010)
-    {"code": "25101010", "name": "Automotive Parts & Equipment", "parent_code": "251010"},
-    {"code": "25101020", "name": "Tires & Rubber", "parent_code": "251010"},
+    {"code": "25101010", "name": "Automotive Parts & Equipment"},
+    {"code": "25101020", "name": "Tires & Rubber"},
     # Automobiles (251020)
-    {"code": "25102010", "name": "Automobile Manufacturers", "parent_code": "251020"},
-    {"code": "25102020", "name": "Motorcycle Manufacturers", "parent_code": "251020"},
+    {"code": "25102010", "name": "Automobile Manufacturers"},
+    {"code": "25102020", "name": "Motorcycle Manufacturers"},
     # Household Durables (252010)
-    {"code": "25201010", "name": "Consumer Electronics", "parent_code": "252010"},
-    {"code": "25201020", "name": "Home Furnishings", "parent_code": "252010"},
-    {"code": "25201030", "name": "Homebuilding", "parent_code": "252010"},
-    {"code": "25201040", "name": "Household Appliances", "parent_code": "252010"},
-    {"code": "25201050", "name": "Housewares & Specialties", "parent_code": "252010"},
+    {"code": "25201010", "name": "Consumer Electronics"},
+    {"code": "25201020", "name": "Home Furnishings"},
+    {"code": "25201030", "name": "Homebuilding"},
+    {"code": "25201040", "name": "Household Appliances"},
+    {"code": "25201050", "name": "Housewares & Specialties"},
     # Leisure Products (252020)
-    {"code": "25202010", "name": "Leisure Products", "parent_code": "252020"},
+    {"code": "25202010", "name": "Leisure Products"},
     # Textiles, Apparel & Luxury Goods (252030)
-    {"code": "25203010", "name": "Apparel, Accessories & Luxury Goods", "parent_code": "252030"},
-    {"code": "25203020", "name": "Footwear", "parent_code": "252030"},
-    {"code": "25203030", "name": "Textiles", "parent_code": "252030"},
+    {"code": "25203010", "name": "Apparel, Accessories & Luxury Goods"},
+    {"code": "25203020", "name": "Footwear"},
+    {"code": "25203030", "name": "Textiles"},
     # Hotels, Restaurants & Leisure (253010)
-    {"code": "25301010", "name": "Casinos & Gaming", "parent_code": "253010"},
-    {"code": "25301020", "name": "Hotels, Resorts & Cruise Lines", "parent_code": "253010"},
-    {"code": "25301030", "name": "Leisure Facilities", "parent_code": "253010"},
-    {"code": "25301040", "name": "Restaurants", "parent_code": "253010"},
+    {"code": "25301010", "name": "Casinos & Gaming"},
+    {"code": "25301020", "name": "Hotels, Resorts & Cruise Lines"},
+    {"code": "25301030", "name": "Leisure Facilities"},
+    {"code": "25301040", "name": "Restaurants"},
     # Diversified Consumer Services (253020)
-    {"code": "25302010", "name": "Education Services", "parent_code": "253020"},
-    {"code": "25302020", "name": "Specialized Consumer Services", "parent_code": "253020"},
+    {"code": "25302010", "name": "Education Services"},
+    {"code": "25302020", "name": "Specialized Consumer Services"},
     # Distributors (255010)
-    {"code": "25501010", "name": "Distributors", "parent_code": "255010"},
+    {"code": "25501010", "name": "Distributors"},
     # Broadline Retail (255020)
-    {"code": "25502010", "name": "Broadline Retail", "parent_code": "255020"},
+    {"code": "25502010", "name": "Broadline Retail"},
     # Specialty Retail (255030)
-    {"code": "25503010", "name": "Apparel Retail", "parent_code": "255030"},
-    {"code": "25503020", "name": "Computer & Electronics Retail", "parent_code": "255030"},
-    {"code": "25503030", "name": "Home Improvement Retail", "parent_code": "255030"},
-    {"code": "25503040", "name": "Other Specialty Retail", "parent_code": "255030"},
-    {"code": "25503050", "name": "Automotive Retail", "parent_code": "255030"},
-    {"code": "25503060", "name": "Homefurnishing Retail", "parent_code": "255030"},
+    {"code": "25503010", "name": "Apparel Retail"},
+    {"code": "25503020", "name": "Computer & Electronics Retail"},
+    {"code": "25503030", "name": "Home Improvement Retail"},
+    {"code": "25503040", "name": "Other Specialty Retail"},
+    {"code": "25503050", "name": "Automotive Retail"},
+    {"code": "25503060", "name": "Homefurnishing Retail"},
     # Consumer Staples Distribution & Retail (301010)
-    {"code": "30101010", "name": "Drug Retail", "parent_code": "301010"},
-    {"code": "30101020", "name": "Food Distributors", "parent_code": "301010"},
-    {"code": "30101030", "name": "Food Retail", "parent_code": "301010"},
-    {"code": "30101040", "name": "Consumer Staples Merchandise Retail", "parent_code": "301010"},
+    {"code": "30101010", "name": "Drug Retail"},
+    {"code": "30101020", "name": "Food Distributors"},
+    {"code": "30101030", "name": "Food Retail"},
+    {"code": "30101040", "name": "Consumer Staples Merchandise Retail"},
     # Beverages (302010)
-    {"code": "30201010", "name": "Brewers", "parent_code": "302010"},
-    {"code": "30201020", "name": "Distillers & Vintners", "parent_code": "302010"},
-    {"code": "30201030", "name": "Soft Drinks & Non-alcoholic Beverages", "parent_code": "302010"},
+    {"code": "30201010", "name": "Brewers"},
+    {"code": "30201020", "name": "Distillers & Vintners"},
+    {"code": "30201030", "name": "Soft Drinks & Non-alcoholic Beverages"},
     # Food Products (302020)
-    {"code": "30202010", "name": "Agricultural Products & Services", "parent_code": "302020"},
-    {"code": "30202030", "name": "Packaged Foods & Meats", "parent_code": "302020"},
+    {"code": "30202010", "name": "Agricultural Products & Services"},
+    {"code": "30202030", "name": "Packaged Foods & Meats"},
     # Tobacco (302030)
-    {"code": "30203010", "name": "Tobacco", "parent_code": "302030"},
+    {"code": "30203010", "name": "Tobacco"},
     # Household Products (303010)
-    {"code": "30301010", "name": "Household Products", "parent_code": "303010"},
+    {"code": "30301010", "name": "Household Products"},
     # Personal Care Products (303020)
-    {"code": "30302010", "name": "Personal Care Products", "parent_code": "303020"},
+    {"code": "30302010", "name": "Personal Care Products"},
     # Health Care Equipment & Supplies (351010)
-    {"code": "35101010", "name": "Health Care Equipment", "parent_code": "351010"},
-    {"code": "35101020", "name": "Health Care Supplies", "parent_code": "351010"},
+    {"code": "35101010", "name": "Health Care Equipment"},
+    {"code": "35101020", "name": "Health Care Supplies"},
     # Health Care Providers & Services (351020)
-    {"code": "35102010", "name": "Health Care Distributors", "parent_code": "351020"},
-    {"code": "35102015", "name": "Health Care Services", "parent_code": "351020"},
-    {"code": "35102020", "name": "Health Care Facilities", "parent_code": "351020"},
-    {"code": "35102030", "name": "Managed Health Care", "parent_code": "351020"},
+    {"code": "35102010", "name": "Health Care Distributors"},
+    {"code": "35102015", "name": "Health Care Services"},
+    {"code": "35102020", "name": "Health Care Facilities"},
+    {"code": "35102030", "name": "Managed Health Care"},
     # Health Care Technology (351030)
-    {"code": "35103010", "name": "Health Care Technology", "parent_code": "351030"},
+    {"code": "35103010", "name": "Health Care Technology"},
     # Biotechnology (352010)
-    {"code": "35201010", "name": "Biotechnology", "parent_code": "352010"},
+    {"code": "35201010", "name": "Biotechnology"},
     # Pharmaceuticals (352020)
-    {"code": "35202010", "name": "Pharmaceuticals", "parent_code": "352020"},
+    {"code": "35202010", "name": "Pharmaceuticals"},
     # Life Sciences Tools & Services (352030)
-    {"code": "35203010", "name": "Life Sciences Tools & Services", "parent_code": "352030"},
+    {"code": "35203010", "name": "Life Sciences Tools & Services"},
     # Banks (401010)
-    {"code": "40101010", "name": "Diversified Banks", "parent_code": "401010"},
-    {"code": "40101015", "name": "Regional Banks", "parent_code": "401010"},
+    {"code": "40101010", "name": "Diversified Banks"},
+    {"code": "40101015", "name": "Regional Banks"},
     # Financial Services (402010)
-    {"code": "40201010", "name": "Diversified Financial Services", "parent_code": "402010"},
-    {"code": "40201020", "name": "Multi-Sector Holdings", "parent_code": "402010"},
-    {"code": "40201030", "name": "Specialized Finance", "parent_code": "402010"},
-    {"code": "40201040", "name": "Commercial & Residential Mortgage Finance", "parent_code": "402010"},
-    {"code": "40201050", "name": "Transaction & Payment Processing Services", "parent_code": "402010"},
+    {"code": "40201010", "name": "Diversified Financial Services"},
+    {"code": "40201020", "name": "Multi-Sector Holdings"},
+    {"code": "40201030", "name": "Specialized Finance"},
+    {"code": "40201040", "name": "Commercial & Residential Mortgage Finance"},
+    {"code": "40201050", "name": "Transaction & Payment Processing Services"},
     # Consumer Finance (402020)
-    {"code": "40202010", "name": "Consumer Finance", "parent_code": "402020"},
+    {"code": "40202010", "name": "Consumer Finance"},
     # Capital Markets (402030)
-    {"code": "40203010", "name": "Asset Management & Custody Banks", "parent_code": "402030"},
-    {"code": "40203020", "name": "Investment Banking & Brokerage", "parent_code": "402030"},
-    {"code": "40203030", "name": "Diversified Capital Markets", "parent_code": "402030"},
-    {"code": "40203040", "name": "Financial Exchanges & Data", "parent_code": "402030"},
+    {"code": "40203010", "name": "Asset Management & Custody Banks"},
+    {"code": "40203020", "name": "Investment Banking & Brokerage"},
+    {"code": "40203030", "name": "Diversified Capital Markets"},
+    {"code": "40203040", "name": "Financial Exchanges & Data"},
     # Mortgage Real Estate Investment Trusts (REITs) (402040)
-    {"code": "40204010", "name": "Mortgage REITs", "parent_code": "402040"},
+    {"code": "40204010", "name": "Mortgage REITs"},
     # Insurance (403010)
-    {"code": "40301010", "name": "Insurance Brokers", "parent_code": "403010"},
-    {"code": "40301020", "name": "Life & Health Insurance", "parent_code": "403010"},
-    {"code": "40301030", "name": "Multi-line Insurance", "parent_code": "403010"},
-    {"code": "40301040", "name": "Property & Casualty Insurance", "parent_code": "403010"},
-    {"code": "40301050", "name": "Reinsurance", "parent_code": "403010"},
+    {"code": "40301010", "name": "Insurance Brokers"},
+    {"code": "40301020", "name": "Life & Health Insurance"},
+    {"code": "40301030", "name": "Multi-line Insurance"},
+    {"code": "40301040", "name": "Property & Casualty Insurance"},
+    {"code": "40301050", "name": "Reinsurance"},
     # IT Services (451010)
-    {"code": "45101010", "name": "IT Consulting & Other Services", "parent_code": "451010"},
-    {"code": "45101020", "name": "Internet Services & Infrastructure", "parent_code": "451010"},
+    {"code": "45101010", "name": "IT Consulting & Other Services"},
+    {"code": "45101020", "name": "Internet Services & Infrastructure"},
     # Software (451020)
-    {"code": "45102010", "name": "Application Software", "parent_code": "451020"},
-    {"code": "45102020", "name": "Systems Software", "parent_code": "451020"},
+    {"code": "45102010", "name": "Application Software"},
+    {"code": "45102020", "name": "Systems Software"},
     # Communications Equipment (452010)
-    {"code": "45201010", "name": "Communications Equipment", "parent_code": "452010"},
+    {"code": "45201010", "name": "Communications Equipment"},
     # Technology Hardware, Storage & Peripherals (452020)
-    {"code": "45202010", "name": "Technology Hardware, Storage & Peripherals", "parent_code": "452020"},
+    {"code": "45202010", "name": "Technology Hardware, Storage & Peripherals"},
     # Electronic Equipment, Instruments & Components (452030)
-    {"code": "45203010", "name": "Electronic Equipment & Instruments", "parent_code": "452030"},
-    {"code": "45203015", "name": "Electronic Components", "parent_code": "452030"},
-    {"code": "45203020", "name": "Electronic Manufacturing Services", "parent_code": "452030"},
-    {"code": "45203030", "name": "Technology Distributors", "parent_code": "452030"},
+    {"code": "45203010", "name": "Electronic Equipment & Instruments"},
+    {"code": "45203015", "name": "Electronic Components"},
+    {"code": "45203020", "name": "Electronic Manufacturing Services"},
+    {"code": "45203030", "name": "Technology Distributors"},
     # Semiconductors & Semiconductor Equipment (453010)
-    {"code": "45301010", "name": "Semiconductor Materials & Equipment", "parent_code": "453010"},
-    {"code": "45301020", "name": "Semiconductors", "parent_code": "453010"},
+    {"code": "45301010", "name": "Semiconductor Materials & Equipment"},
+    {"code": "45301020", "name": "Semiconductors"},
     # Diversified Telecommunication Services (501010)
-    {"code": "50101010", "name": "Alternative Carriers", "parent_code": "501010"},
-    {"code": "50101020", "name": "Integrated Telecommunication Services", "parent_code": "501010"},
+    {"code": "50101010", "name": "Alternative Carriers"},
+    {"code": "50101020", "name": "Integrated Telecommunication Services"},
     # Wireless Telecommunication Services (501020)
-    {"code": "50102010", "name": "Wireless Telecommunication Services", "parent_code": "501020"},
+    {"code": "50102010", "name": "Wireless Telecommunication Services"},
     # Media (502010)
-    {"code": "50201010", "name": "Advertising", "parent_code": "502010"},
-    {"code": "50201020", "name": "Broadcasting", "parent_code": "502010"},
-    {"code": "50201030", "name": "Cable & Satellite", "parent_code": "502010"},
-    {"code": "50201040", "name": "Publishing", "parent_code": "502010"},
+    {"code": "50201010", "name": "Advertising"},
+    {"code": "50201020", "name": "Broadcasting"},
+    {"code": "50201030", "name": "Cable & Satellite"},
+    {"code": "50201040", "name": "Publishing"},
     # Entertainment (502020)
-    {"code": "50202010", "name": "Movies & Entertainment", "parent_code": "502020"},
-    {"code": "50202020", "name": "Interactive Home Entertainment", "parent_code": "502020"},
+    {"code": "50202010", "name": "Movies & Entertainment"},
+    {"code": "50202020", "name": "Interactive Home Entertainment"},
     # Interactive Media & Services (502030)
-    {"code": "50203010", "name": "Interactive Media & Services", "parent_code": "502030"},
+    {"code": "50203010", "name": "Interactive Media & Services"},
     # Electric Utilities (551010)
-    {"code": "55101010", "name": "Electric Utilities", "parent_code": "551010"},
+    {"code": "55101010", "name": "Electric Utilities"},
     # Gas Utilities (551020)
-    {"code": "55102010", "name": "Gas Utilities", "parent_code": "551020"},
+    {"code": "55102010", "name": "Gas Utilities"},
     # Multi-Utilities (551030)
-    {"code": "55103010", "name": "Multi-Utilities", "parent_code": "551030"},
+    {"code": "55103010", "name": "Multi-Utilities"},
     # Water Utilities (551040)
-    {"code": "55104010", "name": "Water Utilities", "parent_code": "551040"},
+    {"code": "55104010", "name": "Water Utilities"},
     # Independent Power and Renewable Electricity Producers (551050)
-    {"code": "55105010", "name": "Independent Power Producers & Energy Traders", "parent_code": "551050"},
-    {"code": "55105020", "name": "Renewable Electricity", "parent_code": "551050"},
+    {"code": "55105010", "name": "Independent Power Producers & Energy Traders"},
+    {"code": "55105020", "name": "Renewable Electricity"},
     # Diversified REITs (601010)
-    {"code": "60101010", "name": "Diversified REITs", "parent_code": "601010"},
+    {"code": "60101010", "name": "Diversified REITs"},
     # Industrial REITs (601020)
-    {"code": "60102010", "name": "Industrial REITs", "parent_code": "601020"},
+    {"code": "60102010", "name": "Industrial REITs"},
     # Hotel & Resort REITs (601025)
-    {"code": "60102510", "name": "Hotel & Resort REITs", "parent_code": "601025"},
+    {"code": "60102510", "name": "Hotel & Resort REITs"},
     # Office REITs (601030)
-    {"code": "60103010", "name": "Office REITs", "parent_code": "601030"},
+    {"code": "60103010", "name": "Office REITs"},
     # Health Care REITs (601040)
-    {"code": "60104010", "name": "Health Care REITs", "parent_code": "601040"},
+    {"code": "60104010", "name": "Health Care REITs"},
     # Residential REITs (601050)
-    {"code": "60105010", "name": "Multi-Family Residential REITs", "parent_code": "601050"},
-    {"code": "60105020", "name": "Single-Family Residential REITs", "parent_code": "601050"},
+    {"code": "60105010", "name": "Multi-Family Residential REITs"},
+    {"code": "60105020", "name": "Single-Family Residential REITs"},
     # Retail REITs (601060)
-    {"code": "60106010", "name": "Retail REITs", "parent_code": "601060"},
+    {"code": "60106010", "name": "Retail REITs"},
     # Specialized REITs (601070)
-    {"code": "60107010", "name": "Other Specialized REITs", "parent_code": "601070"},
-    {"code": "60107015", "name": "Self-Storage REITs", "parent_code": "601070"},
-    {"code": "60107020", "name": "Telecom Tower REITs", "parent_code": "601070"},
-    {"code": "60107030", "name": "Timber REITs", "parent_code": "601070"},
-    {"code": "60107040", "name": "Data Center REITs", "parent_code": "601070"},
+    {"code": "60107010", "name": "Other Specialized REITs"},
+    {"code": "60107015", "name": "Self-Storage REITs"},
+    {"code": "60107020", "name": "Telecom Tower REITs"},
+    {"code": "60107030", "name": "Timber REITs"},
+    {"code": "60107040", "name": "Data Center REITs"},
     # Real Estate Management & Development (602010)
-    {"code": "60201010", "name": "Diversified Real Estate Activities", "parent_code": "602010"},
-    {"code": "60201020", "name": "Real Estate Operating Companies", "parent_code": "602010"},
-    {"code": "60201030", "name": "Real Estate Development", "parent_code": "602010"},
-    {"code": "60201040", "name": "Real Estate Services", "parent_code": "602010"},
+    {"code": "60201010", "name": "Diversified Real Estate Activities"},
+    {"code": "60201020", "name": "Real Estate Operating Companies"},
+    {"code": "60201030", "name": "Real Estate Development"},
+    {"code": "60201040", "name": "Real Estate Services"},
 ]
 
 
-def get_gics_taxonomy() -> list[dict]:
+# Level names by numeric level - 1
+_LEVEL_NAMES: Final[tuple[str, ...]] = ("sector", "industry_group", "industry", "sub_industry")
+
+
+def _build_gics_taxonomy() -> tuple[Mapping[str, Optional[str]], ...]:
+    """Flatten the four GICS levels into one tuple of read-only nodes (runs once at import)."""
+    levels = (GICS_SECTORS, GICS_INDUSTRY_GROUPS, GICS_INDUSTRIES, GICS_SUB_INDUSTRIES)
+    return tuple(
+        MappingProxyType({
+            "code": node["code"],
+            "name": node["name"],
+            # A parent's code is the child's minus its last two digits; sectors have none
+            "parent_code": node["code"][:-2] or None,
+            "level": level,
+        })
+        for nodes, level in zip(levels, _LEVEL_NAMES)
+        for node in nodes
+    )
+
+
+_GICS_TAXONOMY: Final[tuple[Mapping[str, Optional[str]], ...]] = _build_gics_taxonomy()
+
+# The same nodes as parallel columns (struct-of-arrays), in taxonomy order,
+# for the column-wise consumers below; levels are carried as numbers (1-4)
+_CODES, _NAMES, _PARENTS, _LEVEL_NUMS = (
+    tuple(column)
+    for column in zip(*(
+        (n["code"], n["name"], n["parent_code"], _LEVEL_NAMES.index(n["level"]) + 1)
+        for n in _GICS_TAXONOMY
+    ))
+)
+
+_CODE_TO_UUID: Final[dict[str, str]] = dict(zip(_CODES, _deterministic_uuids(_CODES)))
+
+
+def get_gics_taxonomy() -> list[Mapping[str, Optional[str]]]:
     """
-    Return the full GICS taxonomy as a flat list of dicts.
+    Return the full GICS taxonomy as a flat list of nodes.
 
-    Each dict has:
+    Each node has:
     - code: GICS numeric code (str)
     - name: Node name
     - parent_code: Parent GICS code (None for sectors)
     - level: sector, industry_group, industry, sub_industry
+
+    The nodes are read-only mappings built once at import and shared between
+    calls; use dict(node) for a mutable copy.
     """
-    result = []
-
-    # Sectors (level 1)
-    for s in GICS_SECTORS:
-        result.append({
-            "code": s["code"],
-            "name": s["name"],
-            "parent_code": None,
-            "level": "sector",
-        })
+    return list(_GICS_TAXONOMY)
 
-    # Industry Groups (level 2)
-    for ig in GICS_INDUSTRY_GROUPS:
-        result.append({
-            "code": ig["code"],
-            "name": ig["name"],
-            "parent_code": ig["parent_code"],
-            "level": "industry_group",
-        })
 
-    # Industries (level 3)
-    for ind in GICS_INDUSTRIES:
-        result.append({
-            "code": ind["code"],
-            "name": ind["name"],
-            "parent_code": ind["parent_code"],
-            "level": "industry",
-        })
+_NODES_BY_LEVEL: Final[Mapping[str, tuple[Mapping[str, Optional[str]], ...]]] = MappingProxyType({
+    level: tuple(n for n in _GICS_TAXONOMY if n["level"] == level) for level in _LEVEL_NAMES
+})
 
-    # Sub-Industries (level 4)
-    for si in GICS_SUB_INDUSTRIES:
-        result.append({
-            "code": si["code"],
-            "name": si["name"],
-            "parent_code": si["parent_code"],
-            "level": "sub_industry",
-        })
 
-    return result
+def get_gics_nodes_by_level() -> Mapping[str, tuple[Mapping[str, Optional[str]], ...]]:
+    """
+    Return the GICS nodes grouped by level (sector, industry_group, industry, sub_industry).
 
+    Each level maps to a tuple of the same read-only nodes get_gics_taxonomy
+    returns, in taxonomy order; the grouping is built once at import.
+    """
+    return _NODES_BY_LEVEL
 
-def _build_code_to_uuid_map(taxonomy: list[dict]) -> dict[str, str]:
-    """Build a mapping from GICS code to deterministic UUID."""
-    return {node["code"]: _deterministic_uuid(node["code"]) for node in taxonomy}
 
+def _build_descendants() -> Mapping[str, tuple[str, ...]]:
+    """Map each sector, industry group and industry code to the sub-industry codes under it."""
+    descendants: dict[str, list[str]] = {}
+    for node in _NODES_BY_LEVEL["sub_industry"]:
+        code = node["code"]
+        # GICS codes extend their parent's code by two digits
+        for ancestor in (code[:2], code[:4], code[:6]):
+            descendants.setdefault(ancestor, []).append(code)
+    return MappingProxyType({code: tuple(subs) for code, subs in descendants.items()})
 
-def _build_path(node: dict, code_to_name: dict[str, str]) -> str:
-    """Build the hierarchical path for a node."""
-    parts = [node["name"]]
-    parent_code = node.get("parent_code")
 
-    while parent_code:
-        parts.insert(0, code_to_name[parent_code])
-        # Find parent's parent
-        if len(parent_code) == 2:
-            parent_code = None
-        elif len(parent_code) == 4:
-            parent_code = parent_code[:2]
-        elif len(parent_code) == 6:
-            parent_code = parent_code[:4]
-        elif len(parent_code) == 8:
-            parent_code = parent_code[:6]
-        else:
-            parent_code = None
+_DESCENDANTS: Final[Mapping[str, tuple[str, ...]]] = _build_descendants()
+
+
+def get_descendants(code: str) -> tuple[str, ...]:
+    """
+    Return the sub-industry codes under a sector, industry group or industry code.
+
+    Sub-industry and unknown codes have no descendants and return ().
+    """
+    return _DESCENDANTS.get(code, ())
+
+
+def _build_paths() -> dict[str, str]:
+    """Build every node's hierarchical path by extending its parent's (parents come first)."""
+    paths: dict[str, str] = {}
+    for code, name, parent_code in zip(_CODES, _NAMES, _PARENTS):
+        paths[code] = f"{paths[parent_code] if parent_code else ''}/{name}"
+    return paths
 
-    return "/" + "/".join(parts)
 
+_PATH_BY_CODE: Final[dict[str, str]] = _build_paths()
 
-def _get_level_number(level: str) -> int:
-    """Convert level name to numeric level."""
-    return {"sector": 1, "industry_group": 2, "industry": 3, "sub_industry": 4}[level]
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field only when needed, as csv.writer's QUOTE_MINIMAL does."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+_CSV_HEADER: Final[str] = ",".join((
+    "taxonomy_node_id",
+    "taxonomy_version_id",
+    "taxonomy_type",
+    "node_name",
+    "parent_node_id",
+    "path",
+    "level",
+    "source",
+))
+
+# Names and paths are the only free-text columns (several contain commas);
+# they are escaped once here so each CSV row is a plain f-string
+_NAMES_CSV: Final[tuple[str, ...]] = tuple(map(_csv_field, _NAMES))
+_PATHS_CSV: Final[tuple[str, ...]] = tuple(_csv_field(_PATH_BY_CODE[code]) for code in _CODES)
+
+
+@lru_cache(maxsize=None)
+def _render_taxonomy_csv() -> str:
+    """Render the taxonomy CSV text (deterministic, so rendered once per process)."""
+    # Same layout df.to_csv produced: minimal quoting, "\n" line endings
+    lines = [_CSV_HEADER]
+    for code, name, parent_code, level, path in zip(_CODES, _NAMES_CSV, _PARENTS, _LEVEL_NUMS, _PATHS_CSV):
+        lines.append(
+            f"{_CODE_TO_UUID[code]},{_TAXONOMY_VERSION_ID},{_LEVEL_NAMES[level - 1]},{name},"
+            f"{_CODE_TO_UUID.get(parent_code, '')},{path},{level},gics"
+        )
+    return "\n".join(lines) + "\n"
 
 
 def write_gics_taxonomy_to_csv(output_path: Optional[Path] = None) -> Path:
@@ -533,84 +609,88 @@ def write_gics_taxonomy_to_csv(output_path: Optional[Path] = None) -> Path:
     if output_path is None:
         output_path = _repo_root() / "data" / "silver" / "dim_taxonomy_node.csv"
 
-    taxonomy = get_gics_taxonomy()
-    code_to_uuid = _build_code_to_uuid_map(taxonomy)
-    code_to_name = {node["code"]: node["name"] for node in taxonomy}
-
-    # Fixed taxonomy version ID for GICS
-    taxonomy_version_id = str(uuid.uuid5(
-        uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8"),
-        "gics_2023"
-    ))
-
-    rows = []
-    for node in taxonomy:
-        parent_uuid = ""
-        if node["parent_code"]:
-            parent_uuid = code_to_uuid[node["parent_code"]]
-
-        rows.append({
-            "taxonomy_node_id": code_to_uuid[node["code"]],
-            "taxonomy_version_id": taxonomy_version_id,
-            "taxonomy_type": node["level"],
-            "node_name": node["name"],
-            "parent_node_id": parent_uuid,
-            "path": _build_path(node, code_to_name),
-            "level": _get_level_number(node["level"]),
-            "source": "gics",
-        })
-
-    df = pd.DataFrame(rows)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    output_path.write_text(_render_taxonomy_csv(), encoding="utf-8", newline="")
 
     return output_path
 
 
-def get_sub_industry_lookup() -> dict[str, dict]:
+_LOOKUP_PREFIXES: Final[tuple[str, ...]] = tuple(f"gics_{level}" for level in _LEVEL_NAMES)
+
+
+@lru_cache(maxsize=None)
+def get_sub_industry_lookup() -> Mapping[str, Mapping[str, str]]:
     """
-    Return a lookup dict mapping sub_industry code to full hierarchy info.
+    Return a lookup mapping sub_industry code to full hierarchy info.
 
     Used by map_to_gics to get all ancestor codes and names for a sub_industry.
+    The lookup and its records are built once per process and shared between
+    calls, so both are read-only; use dict(record) for a mutable copy.
     """
-    taxonomy = get_gics_taxonomy()
-    code_to_node = {n["code"]: n for n in taxonomy}
-
+    # The taxonomy is ordered sector -> sub_industry, so every parent's
+    # ancestry record exists before its children extend it
+    ancestry: dict[str, dict] = {}
     lookup = {}
-    for node in taxonomy:
-        if node["level"] != "sub_industry":
-            continue
-
-        sub_code = node["code"]
-        ind_code = node["parent_code"]
-        ind_node = code_to_node[ind_code]
-        ig_code = ind_node["parent_code"]
-        ig_node = code_to_node[ig_code]
-        sec_code = ig_node["parent_code"]
-        sec_node = code_to_node[sec_code]
-
-        lookup[sub_code] = {
-            "gics_sector_code": sec_code,
-            "gics_sector_name": sec_node["name"],
-            "gics_industry_group_code": ig_code,
-            "gics_industry_group_name": ig_node["name"],
-            "gics_industry_code": ind_code,
-            "gics_industry_name": ind_node["name"],
-            "gics_sub_industry_code": sub_code,
-            "gics_sub_industry_name": node["name"],
+    for code, name, parent_code, level in zip(_CODES, _NAMES, _PARENTS, _LEVEL_NUMS):
+        prefix = _LOOKUP_PREFIXES[level - 1]
+        record = {
+            **(ancestry[parent_code] if parent_code else {}),
+            f"{prefix}_code": code,
+            f"{prefix}_name": name,
         }
+        if level == 4:
+            lookup[code] = MappingProxyType(record)
+        else:
+            ancestry[code] = record
+
+    return MappingProxyType(lookup)
+
+
+@lru_cache(maxsize=None)
+def _build_sub_industry_lookup_df() -> pd.DataFrame:
+    """Build the categorical lookup frame once; pandas is imported only when it is needed."""
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(
+        list(get_sub_industry_lookup().values()),
+        index="gics_sub_industry_code",
+    )
+    return df.astype("category")
+
+
+def get_sub_industry_lookup_df() -> pd.DataFrame:
+    """
+    Return the sub-industry lookup as a DataFrame indexed by gics_sub_industry_code.
+
+    Same hierarchy columns as get_sub_industry_lookup, as categoricals, for
+    vectorized enrichment: holdings.join(lookup_df, on="gics_sub_industry_code").
+    Prefer the dict lookup for single-row access.
+    """
+    # Deep copy (~160 rows) so callers can never modify the cached frame
+    return _build_sub_industry_lookup_df().copy()
+
+
+def map_sub_industries_to_ancestors(codes: Iterable[str]) -> pd.DataFrame:
+    """
+    Map many sub-industry codes to their full hierarchy in one vectorized step.
+
+    Returns one row per input code, in input order, with gics_sub_industry_code
+    followed by the get_sub_industry_lookup_df columns; unknown codes get NaN.
+    """
+    import pandas as pd
 
-    return lookup
+    index = pd.Index(list(codes), name="gics_sub_industry_code")
+    return _build_sub_industry_lookup_df().reindex(index).reset_index()
 
 
 if __name__ == "__main__":
     # When run directly, write the GICS taxonomy to CSV
     out_path = write_gics_taxonomy_to_csv()
-    taxonomy = get_gics_taxonomy()
+    counts = {level: len(nodes) for level, nodes in get_gics_nodes_by_level().items()}
 
     print(f"Wrote GICS taxonomy to: {out_path}")
-    print(f"  Sectors: {len([n for n in taxonomy if n['level'] == 'sector'])}")
-    print(f"  Industry Groups: {len([n for n in taxonomy if n['level'] == 'industry_group'])}")
-    print(f"  Industries: {len([n for n in taxonomy if n['level'] == 'industry'])}")
-    print(f"  Sub-Industries: {len([n for n in taxonomy if n['level'] == 'sub_industry'])}")
-    print(f"  Total: {len(taxonomy)}")
+    print(f"  Sectors: {counts['sector']}")
+    print(f"  Industry Groups: {counts['industry_group']}")
+    print(f"  Industries: {counts['industry']}")
+    print(f"  Sub-Industries: {counts['sub_industry']}")
+    print(f"  Total: {sum(counts.values())}")